@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Ahead-of-time build of the steam propulsion kernel.
+
+Compiles the numerical core of propulsion_calc into the extension module
+_propulsion_native, so the kernel runs compiled without a JIT compile on
+first use. propulsion_calc imports the extension when it is present and
+otherwise falls back to the JIT (or plain Python) kernel.
+
+Usage:
+    python build_propulsion_native.py
+"""
+
+import os
+from numba.pycc import CC
+
+from propulsion_calc import _propulsion_kernel
+
+cc = CC('_propulsion_native')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export('propulsion_metrics', 'UniTuple(f8, 5)(f8, f8, f8, f8, f8, f8, f8, f8, f8, f8)')
+def propulsion_metrics(T, p_chamber, p_ambient, k, R, cp, Lv, mass, burn, g0):
+    """
+    Compiled entry point of _propulsion_kernel.
+
+    Returns:
+        Tuple of (exhaust velocity, thrust, specific impulse, delta-v, energy required)
+    """
+    return _propulsion_kernel(T, p_chamber, p_ambient, k, R, cp, Lv, mass, burn, g0)
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Built {cc.name} in {cc.output_dir}")
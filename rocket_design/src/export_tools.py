@@ -7,10 +7,43 @@ This module handles exporting to formats like STEP, STL, DXF, and others require
 """
 
 import os
+import csv
+import struct
+import itertools
+from types import MappingProxyType
+import numpy as np
 import FreeCAD as App
-import Import
-import ImportGui
-import Mesh
+
+# Material density lookup (kg/m³)
+MATERIAL_DENSITIES = {
+    "stainless_steel": 7900,
+    "aluminum": 2700,
+    "titanium": 4500,
+    "plastic": 1200,
+    "carbon_fiber": 1600
+}
+DEFAULT_DENSITY = MATERIAL_DENSITIES["aluminum"]
+
+# Shape types that carry a meaningful volume for the BOM
+SOLID_SHAPE_TYPES = ("Solid", "CompSolid", "Compound")
+
+# Projection directions for the standard DXF views
+DXF_VIEWS = MappingProxyType({
+    "top": (0, 0, 1),
+    "front": (0, -1, 0),
+    "side": (1, 0, 0)
+})
+DRAWING_VIEWS = MappingProxyType({**DXF_VIEWS, "isometric": (1, 1, 1)})
+
+# Number of faces projected together when exporting DXF views
+PROJECTION_CHUNK_SIZE = 64
+
+# Binary STL triangle record (same layout as numpy-stl's Mesh dtype)
+STL_RECORD_DTYPE = np.dtype([
+    ("normals", "<f4", (3,)),
+    ("vectors", "<f4", (3, 3)),
+    ("attr", "<u2")
+])
 
 class ModelExporter:
     """Class for exporting FreeCAD models to various file formats."""
@@ -23,18 +56,104 @@ class ModelExporter:
             doc: FreeCAD document containing models to export
         """
         self.doc = doc
+        
+        # Tessellation and projection results keyed by shape hash, so that
+        # STL, DXF and drawing passes share the same work
+        self._tess_cache = {}
+        self._proj_cache = {}
+        
+        # Output directories already created by this exporter
+        self._mkdir_done = set()
+        
+        # Document objects that carry a shape, refreshed when the document's
+        # object count changes
+        self._shape_objects = None
+        self._shape_objects_count = -1
+    
+    def _get_shape_objects(self):
+        """
+        Get the document objects that have a Shape, reusing the last scan.
+        
+        Returns:
+            Tuple of document objects with a Shape attribute
+        """
+        objects = self.doc.Objects
+        if self._shape_objects is None or len(objects) != self._shape_objects_count:
+            self._shape_objects = tuple(obj for obj in objects if hasattr(obj, "Shape"))
+            self._shape_objects_count = len(objects)
+        return self._shape_objects
+    
+    def invalidate_cache(self):
+        """Drop cached shape objects, tessellations and projections after the document changes."""
+        self._shape_objects = None
+        self._tess_cache.clear()
+        self._proj_cache.clear()
+    
+    def _ensure_dir(self, path):
+        """
+        Create a directory (and parents) unless this exporter already did.
+        
+        Args:
+            path: Directory path to create
+        """
+        if path not in self._mkdir_done:
+            os.makedirs(path, exist_ok=True)
+            self._mkdir_done.add(path)
+    
+    def _get_tessellation(self, shape, deflection):
+        """
+        Tessellate a shape, reusing a previous result for the same shape.
+        
+        Args:
+            shape: FreeCAD shape to tessellate
+            deflection: Maximum linear deflection of the mesh
+        
+        Returns:
+            Tuple of (points, facets) as (M, 3) float32 and (N, 3) int32 arrays
+        """
+        key = (shape.hashCode(), deflection)
+        tessellation = self._tess_cache.get(key)
+        if tessellation is None:
+            points, facets = shape.tessellate(deflection)
+            
+            # Copy coordinates straight into flat buffers instead of boxing
+            # every vertex as a tuple
+            points = np.fromiter(itertools.chain.from_iterable(points), dtype=np.float32,
+                                 count=3 * len(points)).reshape(-1, 3)
+            facets = np.fromiter(itertools.chain.from_iterable(facets), dtype=np.int32,
+                                 count=3 * len(facets)).reshape(-1, 3)
+            
+            tessellation = (points, facets)
+            self._tess_cache[key] = tessellation
+        return tessellation
     
-    def export_step(self, filename):
+    def export_step(self, filename, fmt="step"):
         """
         Export the entire document to STEP format.
         
         Args:
             filename: Path to save the STEP file
+            fmt: "step" for ASCII STEP (default, for CAD interchange) or
+                "brep" for OCCT's binary BRep, which is much smaller and
+                faster to write and reload for archival and re-runs
         """
+        if fmt not in ("step", "brep"):
+            raise ValueError(f"Unsupported export format: {fmt}")
+        
         # Ensure the directory exists
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        self._ensure_dir(os.path.dirname(filename))
+        
+        if fmt == "brep":
+            # Write all shapes as one binary BRep compound
+            import Part
+            compound = Part.Compound([obj.Shape for obj in self._get_shape_objects()])
+            compound.exportBinary(filename)
+            
+            print(f"Exported binary BRep file to: {filename}")
+            return
         
         # Export to STEP format
+        import Import
         Import.export(self.doc.Objects, filename)
         
         print(f"Exported STEP file to: {filename}")
@@ -47,26 +166,48 @@ class ModelExporter:
             filename: Path to save the STL file
         """
         # Ensure the directory exists
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        self._ensure_dir(os.path.dirname(filename))
         
-        # Get a compound of all shapes
-        all_shapes = []
-        for obj in self.doc.Objects:
-            if hasattr(obj, "Shape"):
-                all_shapes.append(obj.Shape)
+        # Get all shapes
+        all_shapes = [obj.Shape for obj in self._get_shape_objects()]
         
         if not all_shapes:
             print("Warning: No shapes found to export to STL")
             return
         
-        # Create a mesh from all shapes
-        mesh = Mesh.Mesh()
-        for shape in all_shapes:
-            mesh_from_shape = Mesh.Mesh(shape.tessellate(0.1))
-            mesh.addMesh(mesh_from_shape)
-        
-        # Export to STL
-        mesh.write(filename)
+        # Stream each shape's triangles straight to a binary STL so that only
+        # one shape's mesh is held in memory at a time
+        triangle_count = 0
+        with open(filename, 'wb') as f:
+            # 80-byte header followed by a placeholder triangle count
+            f.write(struct.pack('<80sI', b'', 0))
+            
+            for shape in all_shapes:
+                # Scale deflection with part size (0.1% of the bounding-box
+                # diagonal) so large tubes are not over-tessellated
+                deflection = max(0.05, shape.BoundBox.DiagonalLength * 1e-3)
+                # STL is triangle soup, so write the raw tessellation directly
+                points, facets = self._get_tessellation(shape, deflection)
+                if not len(facets):
+                    continue
+                
+                # Gather triangle corners into an (N, 3, 3) array and compute
+                # unit normals in one vectorized pass
+                triangles = points[facets]
+                normals = np.cross(triangles[:, 1] - triangles[:, 0],
+                                   triangles[:, 2] - triangles[:, 0])
+                lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+                normals /= np.where(lengths > 0, lengths, 1.0)
+                
+                records = np.zeros(len(triangles), dtype=STL_RECORD_DTYPE)
+                records["normals"] = normals
+                records["vectors"] = triangles
+                records.tofile(f)
+                triangle_count += len(records)
+            
+            # Patch in the final triangle count
+            f.seek(80)
+            f.write(struct.pack('<I', triangle_count))
         
         print(f"Exported STL file to: {filename}")
     
@@ -79,27 +220,77 @@ class ModelExporter:
             view_direction: Vector defining projection direction
         """
         # Ensure the directory exists
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        self._ensure_dir(os.path.dirname(filename))
+        
+        shapes = [(obj.Name, obj.Shape) for obj in self._get_shape_objects()]
         
         # Create a new document for the projection
         projection_doc = App.newDocument("TempProjection")
         
-        # Create projection of each object
-        for obj in self.doc.Objects:
-            if hasattr(obj, "Shape"):
-                # Create a projection view
-                projected_shape = self._project_shape(obj.Shape, view_direction)
-                if projected_shape:
-                    projected_obj = projection_doc.addObject("Part::Feature", f"Projection_{obj.Name}")
-                    projected_obj.Shape = projected_shape
+        self._export_projection_view(projection_doc, shapes, view_direction, filename)
+        
+        # Close temporary document
+        App.closeDocument(projection_doc.Name)
+    
+    def export_dxf_multi(self, base_path, views):
+        """
+        Export several 2D projections of the model to DXF format.
+        
+        The document's shapes are collected once and a single temporary
+        projection document is reused for every view.
+        
+        Args:
+            base_path: Base path/name for the DXF files (without extension);
+                each view is saved as "<base_path>_<view_name>.dxf"
+            views: Dictionary mapping view names to projection directions
+        """
+        # Ensure the directory exists
+        self._ensure_dir(os.path.dirname(base_path))
+        
+        # Collect shapes once for all views
+        shapes = [(obj.Name, obj.Shape) for obj in self._get_shape_objects()]
+        
+        # Create a single document for all projections
+        projection_doc = App.newDocument("TempProjection")
+        
+        for view_name, direction in views.items():
+            self._export_projection_view(projection_doc, shapes, direction,
+                                         f"{base_path}_{view_name}.dxf")
+        
+        # Close temporary document
+        App.closeDocument(projection_doc.Name)
+    
+    def _export_projection_view(self, projection_doc, shapes, direction, filename):
+        """
+        Export one projected view through a temporary projection document.
+        
+        The document is left empty afterwards so it can be reused for the
+        next view.
+        
+        Args:
+            projection_doc: Temporary FreeCAD document holding the projections
+            shapes: List of (name, shape) pairs to project
+            direction: Direction vector for projection
+            filename: Path to save the DXF file
+        """
+        # GUI export module is only loaded when DXF output is requested
+        import ImportGui
+        
+        # Create projection of each shape
+        for name, shape in shapes:
+            projected_shape = self._project_shape(shape, direction)
+            if projected_shape:
+                projected_obj = projection_doc.addObject("Part::Feature", f"Projection_{name}")
+                projected_obj.Shape = projected_shape
         
         projection_doc.recompute()
         
         # Export to DXF
         ImportGui.export(projection_doc.Objects, filename)
         
-        # Close temporary document
-        App.closeDocument(projection_doc.Name)
+        # Clear this view's projections before the next one
+        for projected_obj in list(projection_doc.Objects):
+            projection_doc.removeObject(projected_obj.Name)
         
         print(f"Exported DXF file to: {filename}")
     
@@ -114,17 +305,31 @@ class ModelExporter:
         Returns:
             Projected shape or None if projection failed
         """
+        key = (shape.hashCode(), tuple(direction))
+        if key in self._proj_cache:
+            return self._proj_cache[key]
+        
         try:
             # Convert the direction vector to a FreeCAD.Vector
             if not isinstance(direction, App.Vector):
                 direction = App.Vector(*direction)
             
-            # Create a projection
-            projection = shape.project(direction)
-            return projection
+            # Project large shapes in chunks of adjacent faces so OCCT's
+            # surface caches stay warm and intermediate buffers stay small
+            faces = shape.Faces
+            if len(faces) <= PROJECTION_CHUNK_SIZE:
+                projection = shape.project(direction)
+            else:
+                import Part
+                chunks = [Part.Compound(faces[i:i + PROJECTION_CHUNK_SIZE]).project(direction)
+                          for i in range(0, len(faces), PROJECTION_CHUNK_SIZE)]
+                projection = Part.Compound(chunks)
         except Exception as e:
             print(f"Error projecting shape: {e}")
-            return None
+            projection = None
+        
+        self._proj_cache[key] = projection
+        return projection
     
     def export_all_formats(self, base_filename):
         """
@@ -133,19 +338,13 @@ class ModelExporter:
         Args:
             base_filename: Base path/name for the exported files (without extension)
         """
-        # Export to various formats
+        # Export to various formats one after another: the FreeCAD document
+        # and the exporter's caches are not safe to share between threads
         self.export_step(f"{base_filename}.step")
         self.export_stl(f"{base_filename}.stl")
         
         # Export multiple DXF views
-        views = {
-            "top": (0, 0, 1),
-            "front": (0, -1, 0),
-            "side": (1, 0, 0)
-        }
-        
-        for view_name, direction in views.items():
-            self.export_dxf(f"{base_filename}_{view_name}.dxf", direction)
+        self.export_dxf_multi(base_filename, DXF_VIEWS)
         
         # Save the FreeCAD document
         self.doc.saveAs(f"{base_filename}.FCStd")
@@ -160,7 +359,7 @@ class ModelExporter:
             output_dir: Directory to save drawing files
         """
         # Ensure the directory exists
-        os.makedirs(output_dir, exist_ok=True)
+        self._ensure_dir(output_dir)
         
         # In a real implementation, this would use FreeCAD's drawing workbench
         # or TechDraw workbench to create detailed engineering drawings
@@ -168,15 +367,7 @@ class ModelExporter:
         # For this example, we'll just export DXF views
         base_filename = os.path.join(output_dir, "rocket_drawing")
         
-        views = {
-            "top": (0, 0, 1),
-            "front": (0, -1, 0),
-            "side": (1, 0, 0),
-            "isometric": (1, 1, 1)
-        }
-        
-        for view_name, direction in views.items():
-            self.export_dxf(f"{base_filename}_{view_name}.dxf", direction)
+        self.export_dxf_multi(base_filename, DRAWING_VIEWS)
         
         print(f"Generated technical drawings in: {output_dir}")
 
@@ -188,68 +379,59 @@ class ModelExporter:
             filename: Path to save the BOM file
         """
         # Ensure the directory exists
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        self._ensure_dir(os.path.dirname(filename))
         
-        # Prepare BOM data
-        bom_data = []
+        # Prepare BOM data as parallel columns
+        names = []
+        types = []
+        volumes = []
+        materials = []
         
         for obj in self.doc.Objects:
             # Skip objects without proper properties
             if not hasattr(obj, "Label"):
                 continue
-                
-            # Get basic properties
-            item = {
-                "name": obj.Label,
-                "type": obj.TypeId
-            }
             
-            # Get volume and mass if available
+            # Get volume if available; stays NaN otherwise. Only valid solids
+            # are queried so OCCT does not raise for sketches, datums, etc.
+            volume = float("nan")
             if hasattr(obj, "Shape"):
                 try:
-                    item["volume"] = obj.Shape.Volume  # mm³
-                    
-                    # Estimate mass based on density (if available)
-                    if hasattr(obj, "Material"):
-                        # Density lookup (kg/m³)
-                        densities = {
-                            "stainless_steel": 7900,
-                            "aluminum": 2700,
-                            "titanium": 4500,
-                            "plastic": 1200,
-                            "carbon_fiber": 1600
-                        }
-                        
-                        # Get material (default to aluminum)
-                        material = getattr(obj, "Material", "aluminum")
-                        density = densities.get(material, 2700)  # kg/m³
-                        
-                        # Calculate mass (kg) - convert volume from mm³ to m³
-                        item["mass"] = density * (item["volume"] / 1e9)
-                    else:
-                        # Default to aluminum if no material specified
-                        item["mass"] = 2700 * (item["volume"] / 1e9)
-                except:
+                    shape = obj.Shape
+                    if (not shape.isNull() and shape.ShapeType in SOLID_SHAPE_TYPES
+                            and shape.isValid()):
+                        volume = shape.Volume  # mm³
+                except (AttributeError, RuntimeError):
                     pass
             
-            bom_data.append(item)
-        
-        # Write BOM to CSV
-        with open(filename, 'w') as f:
-            # Write header
-            f.write("Component,Type,Volume (mm³),Mass (kg)\n")
-            
-            # Write each item
-            for item in bom_data:
-                volume = item.get("volume", "N/A")
-                mass = item.get("mass", "N/A")
-                
-                if volume != "N/A":
-                    volume = f"{volume:.2f}"
-                
-                if mass != "N/A":
-                    mass = f"{mass:.3f}"
-                
-                f.write(f"{item['name']},{item['type']},{volume},{mass}\n")
+            names.append(obj.Label)
+            types.append(obj.TypeId)
+            volumes.append(volume)
+            # Default to aluminum if no material specified
+            materials.append(getattr(obj, "Material", "aluminum"))
+        
+        # Look up each distinct material once and broadcast the densities
+        # back onto the items
+        unique_materials, material_index = np.unique(np.array(materials, dtype=str),
+                                                     return_inverse=True)
+        density_lut = np.array([MATERIAL_DENSITIES.get(material, DEFAULT_DENSITY)
+                                for material in unique_materials], dtype=float)
+        item_densities = density_lut[material_index]
+        
+        # Calculate all masses (kg) in one vector operation - convert volume
+        # from mm³ to m³
+        volumes = np.array(volumes, dtype=float)
+        masses = item_densities * volumes * 1e-9
+        
+        # Format numeric columns, marking missing values as N/A
+        missing = np.isnan(volumes)
+        volume_text = np.where(missing, "N/A", np.char.mod("%.2f", volumes))
+        mass_text = np.where(missing, "N/A", np.char.mod("%.3f", masses))
+        
+        # Write BOM to CSV through a large buffer in a single writerows call
+        with open(filename, 'w', buffering=1 << 20, newline='') as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(["Component", "Type", "Volume (mm³)", "Mass (kg)"])
+            writer.writerows(zip(names, types, volume_text, mass_text))
         
         print(f"Exported Bill of Materials to: {filename}")
@@ -10,12 +10,11 @@ import os
 import sys
 import math
 import datetime
+import functools
 
-# Add FreeCAD to Python path if not already there
-try:
-    import FreeCAD
-except ImportError:
-    # Properly configure FreeCAD Python path - check common installation locations
+@functools.lru_cache(maxsize=None)
+def find_freecad_bin():
+    """Return the first FreeCAD bin directory found in common install locations, or None."""
     possible_paths = [
         r"C:\Program Files\FreeCAD 1.0\bin",
         r"C:\Program Files\FreeCAD 0.20\bin",
@@ -23,11 +22,17 @@ except ImportError:
         r"C:\Program Files\FreeCAD\bin"
     ]
     
-    freecad_path = None
     for path in possible_paths:
         if os.path.exists(path):
-            freecad_path = path
-            break
+            return path
+    return None
+
+# Add FreeCAD to Python path if not already there
+try:
+    import FreeCAD
+except ImportError:
+    # Properly configure FreeCAD Python path - check common installation locations
+    freecad_path = find_freecad_bin()
     
     if freecad_path:
         sys.path.append(freecad_path)
@@ -62,6 +67,7 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
 DATA_DIR = os.path.join(PROJECT_DIR, "data")
 OUTPUT_DIR = os.path.join(PROJECT_DIR, "output")
+OUTPUT_SUBDIRS = ("models", "reports", "calculations", "graphs")
 
 def setup_environment():
     """Set up the FreeCAD environment and project folders."""
@@ -70,12 +76,12 @@ def setup_environment():
     # Create a new document
     doc = App.newDocument("TwoStageRocket")
     
-    # Ensure output directories exist
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    os.makedirs(os.path.join(OUTPUT_DIR, "models"), exist_ok=True)
-    os.makedirs(os.path.join(OUTPUT_DIR, "reports"), exist_ok=True)
-    os.makedirs(os.path.join(OUTPUT_DIR, "calculations"), exist_ok=True)
-    os.makedirs(os.path.join(OUTPUT_DIR, "graphs"), exist_ok=True)
+    # Ensure output directories exist (makedirs creates OUTPUT_DIR on the
+    # first one; existing directories are skipped without a makedirs walk)
+    for subdir in OUTPUT_SUBDIRS:
+        path = os.path.join(OUTPUT_DIR, subdir)
+        if not os.path.isdir(path):
+            os.makedirs(path, exist_ok=True)
     
     return doc
 
@@ -135,11 +141,7 @@ def main():
     # Create rocket geometry
     print("Creating rocket geometry...")
     rocket_builder = RocketBuilder(doc, config["rocket"])
-    first_stage = rocket_builder.create_first_stage()
-    second_stage = rocket_builder.create_second_stage()
-    nose_cone = rocket_builder.create_nose_cone()
-    fins = rocket_builder.create_fins()
-    stage_connector = rocket_builder.create_stage_separation_mechanism()
+    rocket_components = rocket_builder.build()
     
     # Design engine components
     print("Designing propulsion system...")
@@ -8,12 +8,611 @@ This module provides advanced metrics, calculations, and visualizations for rock
 
 import os
 import math
+import itertools
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Graphs are only written to files; no GUI backend needed
 import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
 import matplotlib.gridspec as gridspec
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.lines import Line2D
 from scipy.integrate import solve_ivp
+from scipy.optimize import brentq
+
+# Numba is optional; without it the trajectory kernels run as plain Python
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Fallback for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Trajectory model constants
+R_EARTH = 6371000.0  # m - Earth radius
+PRESSURE_SCALE_HEIGHT = 7500.0  # m
+DENSITY_SCALE_HEIGHT = 7000.0  # m
+INV_PRESSURE_SCALE_HEIGHT = 1.0 / PRESSURE_SCALE_HEIGHT  # 1/m
+INV_DENSITY_SCALE_HEIGHT = 1.0 / DENSITY_SCALE_HEIGHT  # 1/m
+
+# Tabulated atmosphere: pressure and density ratios to sea level on a
+# uniform altitude grid, linearly interpolated (relative error ~1e-5).
+# Altitudes above the table fall back to the exponential model.
+ATMOSPHERE_TABLE_MAX_ALTITUDE = 200000.0  # m
+ATMOSPHERE_TABLE_SIZE = 4097
+ATMOSPHERE_TABLE_ALTITUDES = np.linspace(0.0, ATMOSPHERE_TABLE_MAX_ALTITUDE, ATMOSPHERE_TABLE_SIZE)
+INV_ATMOSPHERE_TABLE_STEP = (ATMOSPHERE_TABLE_SIZE - 1) / ATMOSPHERE_TABLE_MAX_ALTITUDE  # 1/m
+PRESSURE_RATIO_TABLE = np.exp(-ATMOSPHERE_TABLE_ALTITUDES * INV_PRESSURE_SCALE_HEIGHT)
+DENSITY_RATIO_TABLE = np.exp(-ATMOSPHERE_TABLE_ALTITUDES * INV_DENSITY_SCALE_HEIGHT)
+
+# Number of output samples in a simulated trajectory
+TRAJECTORY_SAMPLES = 2000
+
+# Precision of the stored trajectory arrays; the solver itself runs in
+# float64, its output is only post-processed, reported and plotted
+TRAJECTORY_DTYPE = np.float32
+
+# Number of candidate payloads evaluated in parallel per search round
+PAYLOAD_BATCH_SIZE = 16
+
+# Fixed RK4 step of the batched apogee integrator used in payload sweeps
+BATCH_TIME_STEP = 0.05  # s
+
+# Default resolution of generated graphs (override with ROCKET_GRAPH_DPI,
+# e.g. a low value for quick previews)
+DEFAULT_GRAPH_DPI = int(os.environ.get("ROCKET_GRAPH_DPI", "150"))
+
+# Matplotlib settings applied while rendering graphs; aggressive path
+# simplification drops sub-pixel vertices from the dense trajectory lines
+GRAPH_RC_PARAMS = {"path.simplify": True, "path.simplify_threshold": 1.0}
+
+# zlib level of the saved PNG files (override with ROCKET_GRAPH_COMPRESS_LEVEL);
+# level 1 encodes much faster than Pillow's default of 6 for slightly larger files
+DEFAULT_PNG_COMPRESS_LEVEL = int(os.environ.get("ROCKET_GRAPH_COMPRESS_LEVEL", "1"))
+
+# Worker processes used to render the independent graph groups (override with
+# ROCKET_GRAPH_WORKERS). Rendering is in-process by default; a process pool
+# pickles the analyzer to every worker and needs a spawn-safe host
+GRAPH_WORKERS = int(os.environ.get("ROCKET_GRAPH_WORKERS", "1"))
+
+
+@njit(cache=True)
+def _atmosphere_ratio(table, altitude, inv_scale_height):
+    """
+    Interpolate an atmosphere ratio table at a non-negative altitude.
+    
+    Args:
+        table: PRESSURE_RATIO_TABLE or DENSITY_RATIO_TABLE
+        altitude: Altitude in m (>= 0)
+        inv_scale_height: Inverse scale height used beyond the table
+    
+    Returns:
+        Ratio to the sea-level value
+    """
+    position = altitude * INV_ATMOSPHERE_TABLE_STEP
+    index = int(position)
+    if index >= ATMOSPHERE_TABLE_SIZE - 1:
+        return math.exp(-altitude * inv_scale_height)
+    fraction = position - index
+    return table[index] + fraction * (table[index + 1] - table[index])
+
+
+@njit(cache=True)
+def _atmosphere(altitude, p0, rho0, T0, R_air):
+    """Simplified exponential atmosphere; returns (pressure, density, temperature)."""
+    if altitude < 0:
+        return p0, rho0, T0
+    
+    pressure = p0 * _atmosphere_ratio(PRESSURE_RATIO_TABLE, altitude, INV_PRESSURE_SCALE_HEIGHT)
+    density = rho0 * _atmosphere_ratio(DENSITY_RATIO_TABLE, altitude, INV_DENSITY_SCALE_HEIGHT)
+    temperature = pressure / (density * R_air)
+    
+    return pressure, density, temperature
+
+
+@njit(cache=True)
+def _drag_coefficient(mach):
+    """
+    Simplified drag coefficient as a function of Mach number.
+    
+    Flat 0.2 when subsonic, a linear rise to 0.6 through the transonic
+    range (M 0.8-1.2) and a linear decay to 0.5 up to M 4.2. Written as
+    the sum of two clamped ramps so there is no branch on the Mach regime.
+    """
+    transonic_rise = 0.4 * min(max((mach - 0.8) / 0.4, 0.0), 1.0)
+    supersonic_decay = 0.1 * min(max((mach - 1.2) / 3.0, 0.0), 1.0)
+    return 0.2 + transonic_rise - supersonic_decay
+
+
+@njit(cache=True)
+def _flight_state(t, altitude, velocity, g0, R_air, p0, rho0, T0, burn_time,
+                  thrust_const, wet_mass, dry_mass, mass_flow_rate, reference_area):
+    """
+    Evaluate the rocket's forces and flight condition at one instant.
+    
+    Returns:
+        Tuple of (mass, thrust, drag, acceleration, Mach number, dynamic pressure)
+    """
+    # Current mass and thrust (linear mass decrease during a constant-thrust burn)
+    if t <= burn_time:
+        mass = wet_mass - mass_flow_rate * t
+        thrust = thrust_const
+    else:
+        mass = dry_mass
+        thrust = 0.0
+    
+    # Get atmospheric properties and Mach number
+    _, density, temperature = _atmosphere(altitude, p0, rho0, T0, R_air)
+    speed_of_sound = math.sqrt(1.4 * R_air * temperature)
+    mach = abs(velocity) / speed_of_sound if speed_of_sound > 0 else 0.0
+    
+    # Drag opposes the velocity: F_d = -0.5 * rho * v * |v| * Cd * A, where
+    # v * |v| carries the sign of the velocity
+    signed_velocity_sq = velocity * abs(velocity)
+    dynamic_pressure = 0.5 * density * velocity * velocity
+    drag = -0.5 * density * signed_velocity_sq * _drag_coefficient(mach) * reference_area
+    
+    # Gravitational acceleration (decreases with altitude)
+    gravity = g0 * (R_EARTH / (R_EARTH + altitude)) ** 2
+    
+    acceleration = (thrust + drag) / mass - gravity
+    
+    return mass, thrust, drag, acceleration, mach, dynamic_pressure
+
+
+@njit(cache=True, fastmath=True)
+def _dynamics(t, y, g0, R_air, p0, rho0, T0, burn_time, thrust_const, wet_mass,
+              dry_mass, mass_flow_rate, reference_area):
+    """Right-hand side of the trajectory ODE for y = [altitude, velocity]."""
+    acceleration = _flight_state(t, y[0], y[1], g0, R_air, p0, rho0, T0, burn_time,
+                                 thrust_const, wet_mass, dry_mass, mass_flow_rate,
+                                 reference_area)[3]
+    
+    dydt = np.empty(2)
+    dydt[0] = y[1]
+    dydt[1] = acceleration
+    return dydt
+
+
+@njit(cache=True, fastmath=True)
+def _jacobian(t, y, g0, R_air, p0, rho0, T0, burn_time, thrust_const, wet_mass,
+              dry_mass, mass_flow_rate, reference_area):
+    """
+    Analytic Jacobian of _dynamics with respect to y = [altitude, velocity].
+    
+    The drag coefficient is treated as locally constant, so only the density
+    and velocity dependence of drag and the altitude dependence of gravity
+    are differentiated.
+    """
+    altitude = y[0]
+    velocity = y[1]
+    mass, _, drag, _, _, _ = _flight_state(t, altitude, velocity, g0, R_air, p0, rho0, T0,
+                                           burn_time, thrust_const, wet_mass, dry_mass,
+                                           mass_flow_rate, reference_area)
+    
+    # Density decays exponentially above ground: dD/dh = -D / H_rho
+    ddrag_dh = -drag * INV_DENSITY_SCALE_HEIGHT if altitude >= 0 else 0.0
+    # D = -0.5 * rho * v * |v| * Cd * A, so dD/dv = 2 * D / v, which is
+    # derived from the drag already evaluated instead of redoing the
+    # atmosphere and drag coefficient
+    ddrag_dv = 2.0 * drag / velocity if velocity != 0 else 0.0
+    dgravity_dh = -2.0 * g0 * R_EARTH ** 2 / (R_EARTH + altitude) ** 3
+    
+    jac = np.empty((2, 2))
+    jac[0, 0] = 0.0
+    jac[0, 1] = 1.0
+    jac[1, 0] = ddrag_dh / mass - dgravity_dh
+    jac[1, 1] = ddrag_dv / mass
+    return jac
+
+
+@njit(cache=True, fastmath=True)
+def _rk4_apogee(max_time, time_step, g0, R_air, p0, rho0, T0, burn_time, thrust_const,
+                wet_mass, dry_mass, mass_flow_rate, reference_area):
+    """
+    Integrate a launch from rest with fixed-step RK4 and return its apogee.
+    
+    Integration stops once the rocket is descending after burnout.
+    """
+    altitude = 0.0
+    velocity = 0.0
+    apogee = 0.0
+    t = 0.0
+    half_step = 0.5 * time_step
+    while t < max_time:
+        k1_h = velocity
+        k1_v = _flight_state(t, altitude, velocity, g0, R_air, p0, rho0, T0, burn_time,
+                             thrust_const, wet_mass, dry_mass, mass_flow_rate, reference_area)[3]
+        k2_h = velocity + half_step * k1_v
+        k2_v = _flight_state(t + half_step, altitude + half_step * k1_h, k2_h, g0, R_air, p0,
+                             rho0, T0, burn_time, thrust_const, wet_mass, dry_mass,
+                             mass_flow_rate, reference_area)[3]
+        k3_h = velocity + half_step * k2_v
+        k3_v = _flight_state(t + half_step, altitude + half_step * k2_h, k3_h, g0, R_air, p0,
+                             rho0, T0, burn_time, thrust_const, wet_mass, dry_mass,
+                             mass_flow_rate, reference_area)[3]
+        k4_h = velocity + time_step * k3_v
+        k4_v = _flight_state(t + time_step, altitude + time_step * k3_h, k4_h, g0, R_air, p0,
+                             rho0, T0, burn_time, thrust_const, wet_mass, dry_mass,
+                             mass_flow_rate, reference_area)[3]
+        
+        altitude += time_step / 6.0 * (k1_h + 2.0 * k2_h + 2.0 * k3_h + k4_h)
+        velocity += time_step / 6.0 * (k1_v + 2.0 * k2_v + 2.0 * k3_v + k4_v)
+        t += time_step
+        
+        if altitude > apogee:
+            apogee = altitude
+        elif velocity < 0 and t > burn_time:
+            break
+    
+    return apogee
+
+
+@njit(cache=True, parallel=True)
+def _batch_apogees(dry_masses, max_time, time_step, g0, R_air, p0, rho0, T0, burn_time,
+                   thrust_const, wet_mass, dry_mass, mass_flow_rate, reference_area):
+    """
+    Apogees of several dry-mass variants of the same rocket, in parallel.
+    
+    Each entry of dry_masses replaces dry_mass in the trajectory parameters
+    while the propellant load (wet_mass - dry_mass) is kept.
+    
+    Returns:
+        Array of apogees in m, one per dry mass
+    """
+    propellant_mass = wet_mass - dry_mass
+    apogees = np.empty(dry_masses.size)
+    for i in prange(dry_masses.size):
+        apogees[i] = _rk4_apogee(max_time, time_step, g0, R_air, p0, rho0, T0, burn_time,
+                                 thrust_const, dry_masses[i] + propellant_mass, dry_masses[i],
+                                 mass_flow_rate, reference_area)
+    return apogees
+
+
+def _trajectory_quantities(time, altitude, velocity, g0, R_air, p0, rho0, T0,
+                           burn_time, thrust_const, wet_mass, dry_mass,
+                           mass_flow_rate, reference_area):
+    """
+    Evaluate derived trajectory quantities at every solver time step.
+    
+    Vectorized NumPy counterpart of _flight_state over whole solution arrays.
+    
+    Returns:
+        (6, N) array with rows mass, thrust, drag, acceleration,
+        Mach number and dynamic pressure, in the dtype of time
+    """
+    # One contiguous block for all outputs; every row is fully overwritten
+    dtype = time.dtype
+    results = np.empty((6, time.size), dtype=dtype)
+    mass, thrust, drag, acceleration, mach, dynamic_pressure = results
+    
+    # Current mass and thrust
+    burning = time <= burn_time
+    np.copyto(mass, dry_mass)
+    np.copyto(mass, wet_mass - mass_flow_rate * time, where=burning)
+    np.copyto(thrust, 0.0)
+    np.copyto(thrust, thrust_const, where=burning)
+    
+    # Atmospheric properties (sea-level values below ground) from the
+    # tabulated atmosphere, matching the compiled right-hand side
+    clamped_altitude = np.maximum(altitude, 0.0)
+    pressure = np.interp(clamped_altitude, ATMOSPHERE_TABLE_ALTITUDES,
+                         PRESSURE_RATIO_TABLE).astype(dtype, copy=False)
+    density = np.interp(clamped_altitude, ATMOSPHERE_TABLE_ALTITUDES,
+                        DENSITY_RATIO_TABLE).astype(dtype, copy=False)
+    beyond_table = clamped_altitude > ATMOSPHERE_TABLE_MAX_ALTITUDE
+    if beyond_table.any():
+        pressure[beyond_table] = np.exp(clamped_altitude[beyond_table] * -INV_PRESSURE_SCALE_HEIGHT)
+        density[beyond_table] = np.exp(clamped_altitude[beyond_table] * -INV_DENSITY_SCALE_HEIGHT)
+    pressure *= p0
+    density *= rho0
+    temperature = np.where(altitude < 0, T0, pressure / (density * R_air))
+    
+    # Mach number and drag coefficient
+    speed_of_sound = np.sqrt(1.4 * R_air * temperature)
+    np.divide(np.abs(velocity), speed_of_sound, out=mach)
+    cd = (0.2 + 0.4 * np.clip((mach - 0.8) / 0.4, 0.0, 1.0)
+          - 0.1 * np.clip((mach - 1.2) / 3.0, 0.0, 1.0))
+    
+    # Dynamic pressure and drag opposing the velocity (v * |v| carries
+    # the sign, so no copysign is needed)
+    half_density = 0.5 * density
+    np.multiply(half_density, velocity, out=dynamic_pressure)
+    dynamic_pressure *= velocity
+    np.multiply(half_density, velocity * np.abs(velocity), out=drag)
+    drag *= cd * -reference_area
+    
+    # Gravitational acceleration (decreases with altitude)
+    gravity = g0 * (R_EARTH / (R_EARTH + altitude)) ** 2
+    np.add(thrust, drag, out=acceleration)
+    acceleration /= mass
+    acceleration -= gravity
+    
+    return results
+
+
+FlowSolution = namedtuple("FlowSolution", [
+    "chamber_pressure", "chamber_temperature",
+    "throat_pressure", "throat_temperature", "throat_velocity",
+    "mass_flow_rate",
+    "exit_pressure", "exit_temperature", "exit_mach", "exit_velocity",
+    "thrust", "specific_impulse"
+])
+
+
+IsentropicConstants = namedtuple("IsentropicConstants", [
+    "gm1", "gp1", "half_gm1", "gexp", "inv_gexp", "area_exp",
+    "p_ratio_throat", "t_ratio_throat", "mflow_const", "gamma_R"
+])
+
+
+@lru_cache(maxsize=16)
+def _isentropic_constants(gamma, R):
+    """
+    Precompute the gamma-dependent factors of the isentropic flow relations.
+    
+    Args:
+        gamma: Specific heat ratio of the propellant
+        R: Gas constant of the propellant in J/(kg·K)
+    
+    Returns:
+        IsentropicConstants of plain floats
+    """
+    gm1 = gamma - 1
+    gp1 = gamma + 1
+    gexp = gamma / gm1
+    area_exp = gp1 / (2 * gm1)
+    return IsentropicConstants(
+        gm1=gm1,
+        gp1=gp1,
+        half_gm1=gm1 / 2,
+        gexp=gexp,
+        inv_gexp=gm1 / gamma,
+        area_exp=area_exp,
+        # p_t/p_0 = (2/(gamma+1))^(gamma/(gamma-1))
+        p_ratio_throat=(2 / gp1)**gexp,
+        t_ratio_throat=2 / gp1,
+        # sqrt(gamma/R) * ((gamma+1)/2)^(-(gamma+1)/(2*(gamma-1)))
+        mflow_const=math.sqrt(gamma / R) * (gp1 / 2)**(-area_exp),
+        gamma_R=gamma * R
+    )
+
+
+# Mach ranges and resolution of the tabulated area-Mach relation
+SUBSONIC_MACH_RANGE = (0.01, 1.0)
+SUPERSONIC_MACH_RANGE = (1.0, 5.0)
+AREA_MACH_TABLE_SIZE = 4096
+
+
+@lru_cache(maxsize=16)
+def _area_mach_table(gamma, supersonic):
+    """
+    Tabulate one branch of the isentropic area-Mach relation.
+    
+    Args:
+        gamma: Specific heat ratio of the propellant
+        supersonic: True for the supersonic branch, False for the subsonic one
+    
+    Returns:
+        Tuple of (area ratios A/A*, Mach numbers) ordered by increasing
+        area ratio, for inverting the relation with np.interp
+    """
+    gm1 = gamma - 1
+    gp1 = gamma + 1
+    mach_range = SUPERSONIC_MACH_RANGE if supersonic else SUBSONIC_MACH_RANGE
+    mach_grid = np.linspace(*mach_range, AREA_MACH_TABLE_SIZE)
+    # A/A* = (1/M) * ((2 + (gamma-1)*M^2)/(gamma+1))^((gamma+1)/(2*(gamma-1)))
+    area_ratio_grid = (1 / mach_grid) * ((2 + gm1 * mach_grid**2) / gp1) ** (gp1 / (2 * gm1))
+    if not supersonic:
+        # Area ratio falls as subsonic Mach number rises
+        area_ratio_grid = area_ratio_grid[::-1].copy()
+        mach_grid = mach_grid[::-1].copy()
+    area_ratio_grid.flags.writeable = False
+    mach_grid.flags.writeable = False
+    return area_ratio_grid, mach_grid
+
+
+@lru_cache(maxsize=512)
+def _compute_flow(p0, T0, A_t, A_e, gamma, R, p_amb, g0):
+    """
+    Solve the isentropic nozzle flow for a set of engine parameters.
+    
+    Args:
+        p0: Chamber pressure in Pa
+        T0: Chamber temperature in K
+        A_t: Throat area in m²
+        A_e: Exit area in m²
+        gamma: Specific heat ratio of the propellant
+        R: Gas constant of the propellant in J/(kg·K)
+        p_amb: Ambient pressure in Pa
+        g0: Standard gravity in m/s²
+    
+    Returns:
+        FlowSolution with chamber, throat and exit conditions and performance
+    """
+    c = _isentropic_constants(gamma, R)
+    
+    # Calculate critical (throat) properties
+    throat_pressure = p0 * c.p_ratio_throat
+    throat_temperature = T0 * c.t_ratio_throat
+    
+    # Calculate sonic velocity at throat
+    throat_velocity = math.sqrt(c.gamma_R * throat_temperature)
+    
+    # Calculate mass flow rate (constant throughout nozzle)
+    # ṁ = (p_0 * A_t) / sqrt(T_0) * sqrt(gamma/R) * (gamma+1)/2)^(-(gamma+1)/(2*(gamma-1)))
+    mass_flow_rate = (p0 * A_t) / math.sqrt(T0) * c.mflow_const
+    
+    # Estimate exit Mach number using approximation formula
+    # (Only valid for moderate expansion ratios)
+    # More accurate calculation would use numerical methods to solve
+    # A_e/A_t = (1/M_e) * ((1+(gamma-1)/2 * M_e^2)/((gamma+1)/2))^((gamma+1)/(2*(gamma-1)))
+    expansion_ratio = A_e / A_t
+    exit_mach = math.sqrt(2/c.gm1 * (expansion_ratio**c.inv_gexp - 1))
+    
+    # Calculate exit properties
+    # p_e/p_0 = (1 + (gamma-1)/2 * M_e^2)^(-gamma/(gamma-1))
+    stagnation_ratio = 1 + c.half_gm1 * exit_mach**2
+    exit_pressure = p0 * stagnation_ratio**(-c.gexp)
+    exit_temperature = T0 / stagnation_ratio
+    
+    # Calculate exit velocity
+    exit_velocity = math.sqrt(c.gamma_R * exit_temperature) * exit_mach
+    
+    # F = ṁ * v_e + (p_e - p_a) * A_e
+    thrust = mass_flow_rate * exit_velocity + (exit_pressure - p_amb) * A_e
+    
+    # Specific impulse = thrust / (mass flow rate * g0)
+    specific_impulse = thrust / (mass_flow_rate * g0)
+    
+    return FlowSolution(
+        p0, T0,
+        throat_pressure, throat_temperature, throat_velocity,
+        mass_flow_rate,
+        exit_pressure, exit_temperature, exit_mach, exit_velocity,
+        thrust, specific_impulse
+    )
+
+
+@njit(cache=True, fastmath=True)
+def _pressure_ratio_curve(expansion_ratios, gamma):
+    """
+    Simplified exit-to-chamber pressure ratio, p_e/p_0 = (1/ER)^gamma.
+    
+    Args:
+        expansion_ratios: Array of nozzle expansion ratios
+        gamma: Specific heat ratio of the propellant
+    
+    Returns:
+        Array of pressure ratios
+    """
+    ratios = np.empty(expansion_ratios.size)
+    for i in range(expansion_ratios.size):
+        ratios[i] = (1.0 / expansion_ratios[i]) ** gamma
+    return ratios
+
+
+@njit(cache=True, fastmath=True)
+def _optimal_expansion_ratios(ambient_pressures, chamber_pressure, gamma):
+    """
+    Expansion ratios that match the exit pressure to each ambient pressure.
+    
+    Inverse of _pressure_ratio_curve (simplified approximation).
+    
+    Args:
+        ambient_pressures: Array of ambient pressures in Pa
+        chamber_pressure: Chamber pressure in Pa
+        gamma: Specific heat ratio of the propellant
+    
+    Returns:
+        Array of optimal expansion ratios
+    """
+    inv_gamma = 1.0 / gamma
+    optimal = np.empty(ambient_pressures.size)
+    for i in range(ambient_pressures.size):
+        optimal[i] = (chamber_pressure / ambient_pressures[i]) ** inv_gamma
+    return optimal
+
+
+@lru_cache(maxsize=8)
+def _ideal_pressure_ratio_curve(gamma, min_ratio=1.0, max_ratio=30.0, num_points=50):
+    """
+    Memoized ideal pressure-ratio curve of the pressure ratio graph.
+    
+    Expansion ratios are spaced geometrically, so the power-law curve is
+    sampled evenly on the graph's logarithmic pressure-ratio axis.
+    
+    Args:
+        gamma: Specific heat ratio of the propellant
+        min_ratio: Smallest expansion ratio
+        max_ratio: Largest expansion ratio
+        num_points: Number of points on the curve
+    
+    Returns:
+        Read-only tuple of (expansion ratios, pressure ratios) arrays
+    """
+    expansion_ratios = np.geomspace(min_ratio, max_ratio, num_points)
+    pr_ideal = _pressure_ratio_curve(expansion_ratios, gamma)
+    expansion_ratios.flags.writeable = False
+    pr_ideal.flags.writeable = False
+    return expansion_ratios, pr_ideal
+
+
+AltitudePressureRatios = namedtuple("AltitudePressureRatios", [
+    "ambient_pressures", "p_ratios", "optimal_ers"
+])
+
+
+@lru_cache(maxsize=8)
+def _altitude_pressure_ratios(altitudes, p0, chamber_pressure, gamma):
+    """
+    Memoized ambient pressure ratios and optimal expansion ratios at a set of altitudes.
+    
+    Args:
+        altitudes: Tuple of altitudes in meters
+        p0: Sea level pressure in Pa
+        chamber_pressure: Chamber pressure in Pa
+        gamma: Specific heat ratio of the propellant
+    
+    Returns:
+        AltitudePressureRatios of read-only arrays
+    """
+    # Atmospheric pressure at each altitude (simplified exponential model)
+    ambient_pressures = p0 * np.exp(-np.asarray(altitudes, dtype=float) * INV_PRESSURE_SCALE_HEIGHT)
+    p_ratios = ambient_pressures / chamber_pressure
+    optimal_ers = _optimal_expansion_ratios(ambient_pressures, float(chamber_pressure), gamma)
+    for array in (ambient_pressures, p_ratios, optimal_ers):
+        array.flags.writeable = False
+    return AltitudePressureRatios(ambient_pressures, p_ratios, optimal_ers)
+
+
+def _flow_properties_vectorized(p0, T0, A_t, A_e, gamma, R, p_amb, g0):
+    """
+    Thrust and specific impulse of the nozzle over arrays of engine parameters.
+    
+    Same closed-form relations as _compute_flow, broadcast over NumPy
+    arrays so design sweeps are evaluated in one pass.
+    
+    Args:
+        p0: Chamber pressure in Pa (scalar or array)
+        T0: Chamber temperature in K (scalar or array)
+        A_t: Throat area in m² (scalar or array)
+        A_e: Exit area in m² (scalar or array)
+        gamma: Specific heat ratio of the propellant
+        R: Gas constant of the propellant in J/(kg·K)
+        p_amb: Ambient pressure in Pa
+        g0: Standard gravity in m/s²
+    
+    Returns:
+        Tuple of (thrust in N, specific impulse in s) arrays
+    """
+    c = _isentropic_constants(gamma, R)
+    p0 = np.asarray(p0, dtype=float)
+    A_e = np.asarray(A_e, dtype=float)
+    
+    mass_flow_rate = p0 * A_t / np.sqrt(T0) * c.mflow_const
+    
+    # Exit Mach number from the same approximation as _compute_flow
+    expansion_ratio = A_e / A_t
+    exit_mach = np.sqrt(2/c.gm1 * (np.power(expansion_ratio, c.inv_gexp) - 1))
+    stagnation_ratio = 1 + c.half_gm1 * exit_mach * exit_mach
+    exit_pressure = p0 * np.power(stagnation_ratio, -c.gexp)
+    exit_velocity = np.sqrt(c.gamma_R * T0 / stagnation_ratio) * exit_mach
+    
+    thrust = mass_flow_rate * exit_velocity + (exit_pressure - p_amb) * A_e
+    specific_impulse = thrust / (mass_flow_rate * g0)
+    
+    return thrust, specific_impulse
 
 
 class RocketPerformanceAnalyzer:
@@ -90,82 +689,73 @@ class RocketPerformanceAnalyzer:
         Returns:
             Dictionary of flow properties at different locations
         """
-        # Initialize flow properties dictionary
-        flow = {}
-        
-        # Chamber properties
-        flow["chamber"] = {
-            "pressure": self.chamber_pressure,  # Pa
-            "temperature": self.chamber_temperature,  # K
-            "velocity": 0  # m/s (approximately zero in chamber)
-        }
-        
-        # Calculate critical (throat) properties
-        # For isentropic flow: p_t/p_0 = (2/(gamma+1))^(gamma/(gamma-1))
-        gamma = self.gamma_steam
-        p_ratio_throat = (2/(gamma+1))**(gamma/(gamma-1))
-        t_ratio_throat = 2/(gamma+1)
-        
-        flow["throat"] = {
-            "pressure": self.chamber_pressure * p_ratio_throat,
-            "temperature": self.chamber_temperature * t_ratio_throat,
-            "mach": 1.0  # By definition, M=1 at throat
-        }
-        
-        # Calculate sonic velocity at throat
-        a_throat = math.sqrt(gamma * self.R_steam * flow["throat"]["temperature"])
-        flow["throat"]["velocity"] = a_throat
-        
-        # Calculate mass flow rate (constant throughout nozzle)
-        # ṁ = (p_0 * A_t) / sqrt(T_0) * sqrt(gamma/R) * (gamma+1)/2)^(-(gamma+1)/(2*(gamma-1)))
-        constant_term = math.sqrt(gamma/self.R_steam) * ((gamma+1)/2)**(-((gamma+1)/(2*(gamma-1))))
-        mass_flow_rate = (self.chamber_pressure * self.throat_area) / math.sqrt(self.chamber_temperature) * constant_term
-        flow["mass_flow_rate"] = mass_flow_rate  # kg/s
-        
-        # Calculate exit conditions (assuming optimal expansion)
-        # p_e/p_0 = (1 + (gamma-1)/2 * M_e^2)^(-gamma/(gamma-1))
-        # Need to iterate to find M_e based on expansion ratio
-        
-        # Estimate exit Mach number using approximation formula
-        # (Only valid for moderate expansion ratios)
-        M_exit_approx = math.sqrt(2/(gamma-1) * ((self.expansion_ratio)**((gamma-1)/gamma) - 1))
-        
-        # More accurate calculation would use numerical methods to solve
-        # A_e/A_t = (1/M_e) * ((1+(gamma-1)/2 * M_e^2)/((gamma+1)/2))^((gamma+1)/(2*(gamma-1)))
-        
-        # Calculate exit properties
-        p_ratio_exit = (1 + (gamma-1)/2 * M_exit_approx**2)**(-gamma/(gamma-1))
-        t_ratio_exit = (1 + (gamma-1)/2 * M_exit_approx**2)**(-1)
+        # Engine-only calculation, memoized on the exact engine parameters
+        # with sea-level ambient pressure
+        solution = _compute_flow(
+            self.chamber_pressure, self.chamber_temperature,
+            self.throat_area, self.exit_area,
+            self.gamma_steam, self.R_steam, self.p0, self.g0
+        )
         
-        flow["exit"] = {
-            "pressure": self.chamber_pressure * p_ratio_exit,
-            "temperature": self.chamber_temperature * t_ratio_exit,
-            "mach": M_exit_approx
+        flow = {
+            "chamber": {
+                "pressure": solution.chamber_pressure,  # Pa
+                "temperature": solution.chamber_temperature,  # K
+                "velocity": 0  # m/s (approximately zero in chamber)
+            },
+            "throat": {
+                "pressure": solution.throat_pressure,
+                "temperature": solution.throat_temperature,
+                "mach": 1.0,  # By definition, M=1 at throat
+                "velocity": solution.throat_velocity
+            },
+            "mass_flow_rate": solution.mass_flow_rate,  # kg/s
+            "exit": {
+                "pressure": solution.exit_pressure,
+                "temperature": solution.exit_temperature,
+                "mach": solution.exit_mach,
+                "velocity": solution.exit_velocity
+            }
         }
         
-        # Calculate exit velocity
-        a_exit = math.sqrt(gamma * self.R_steam * flow["exit"]["temperature"])
-        flow["exit"]["velocity"] = a_exit * M_exit_approx
-        
         # Store results
         self.flow_properties = flow
         
-        # Calculate thrust and specific impulse
-        p_ambient = self.p0  # Pa, ambient pressure at sea level
-        
-        # F = ṁ * v_e + (p_e - p_a) * A_e
-        thrust = mass_flow_rate * flow["exit"]["velocity"] + (flow["exit"]["pressure"] - p_ambient) * self.exit_area
-        
-        # Specific impulse = thrust / (mass flow rate * g0)
-        isp = thrust / (mass_flow_rate * self.g0)
-        
         # Store performance metrics
-        self.performance_metrics["thrust"] = thrust  # N
-        self.performance_metrics["specific_impulse"] = isp  # s
-        self.performance_metrics["exhaust_velocity"] = flow["exit"]["velocity"]  # m/s
+        self.performance_metrics["thrust"] = solution.thrust  # N
+        self.performance_metrics["specific_impulse"] = solution.specific_impulse  # s
+        self.performance_metrics["exhaust_velocity"] = solution.exit_velocity  # m/s
         
         return flow
 
+    def _trajectory_params(self):
+        """
+        Collect the scalar model parameters of the compiled trajectory kernels.
+        
+        They are resolved once per simulation so the right-hand side never
+        touches self or the config dicts and only sees plain floats.
+        
+        Returns:
+            Tuple of (g0, R_air, p0, rho0, T0, burn_time, thrust, wet_mass,
+            dry_mass, mass_flow_rate, reference_area)
+        """
+        # Rocket parameters (wet mass follows dry mass so payload studies that
+        # adjust self.dry_mass see the heavier vehicle during the burn too)
+        wet_mass = self.dry_mass + self.propellant_mass  # kg
+        dry_mass = self.dry_mass  # kg
+        burn_time = self.burn_time  # s
+        mass_flow_rate = self.propellant_mass / burn_time  # kg/s
+        
+        # Reference area (cross-sectional area of the rocket)
+        diameter = self.rocket_config["max_diameter"] / 1000  # m
+        reference_area = math.pi * (diameter / 2) ** 2
+        
+        return (
+            float(self.g0), float(self.R_air), float(self.p0), float(self.rho0),
+            float(self.T0), float(burn_time), float(self.performance_metrics["thrust"]),
+            float(wet_mass), float(dry_mass), float(mass_flow_rate), float(reference_area)
+        )
+        
     def analyze_trajectory(self, initial_altitude=0, initial_velocity=0, max_time=500):
         """
         Simulate the rocket trajectory to calculate maximum altitude and performance.
@@ -178,95 +768,7 @@ class RocketPerformanceAnalyzer:
         Returns:
             Dictionary containing trajectory data
         """
-        # Rocket parameters
-        wet_mass = self.total_mass  # kg
-        dry_mass = self.dry_mass  # kg
-        propellant_mass = self.propellant_mass  # kg
-        burn_time = self.burn_time  # s
-        
-        # Thrust as a function of time (could be variable, using constant for simplicity)
-        def thrust_function(t):
-            if t <= burn_time:
-                return self.performance_metrics["thrust"]
-            else:
-                return 0.0
-        
-        # Mass as a function of time (linear mass decrease during burn)
-        def mass_function(t):
-            if t <= burn_time:
-                return wet_mass - (propellant_mass / burn_time) * t
-            else:
-                return dry_mass
-        
-        # Atmospheric properties as a function of altitude
-        def atmospheric_properties(altitude):
-            # Using simplified exponential atmosphere model
-            # For more accuracy, would use a standard atmosphere model
-            if altitude < 0:
-                return self.p0, self.rho0, self.T0
-            
-            # Scale heights
-            h_p = 7500  # m, pressure scale height
-            h_rho = 7000  # m, density scale height
-            
-            pressure = self.p0 * math.exp(-altitude / h_p)
-            density = self.rho0 * math.exp(-altitude / h_rho)
-            temperature = pressure / (density * self.R_air)
-            
-            return pressure, density, temperature
-        
-        # Calculate drag coefficient as a function of Mach number (simplified)
-        def drag_coefficient(mach):
-            # Simplified model, would be more complex in real analysis
-            if mach < 0.8:
-                return 0.2  # Subsonic
-            elif mach < 1.2:
-                return 0.2 + 0.4 * (mach - 0.8) / 0.4  # Transonic
-            else:
-                return 0.6 - 0.1 * min(mach - 1.2, 3) / 3  # Supersonic
-        
-        # Calculate drag force
-        def drag_force(altitude, velocity):
-            # Get atmospheric properties
-            _, density, temperature = atmospheric_properties(altitude)
-            
-            # Calculate Mach number
-            speed_of_sound = math.sqrt(1.4 * self.R_air * temperature)
-            mach = abs(velocity) / speed_of_sound if speed_of_sound > 0 else 0
-            
-            # Reference area (cross-sectional area of the rocket)
-            diameter = self.rocket_config["max_diameter"] / 1000  # m
-            reference_area = math.pi * (diameter / 2) ** 2
-            
-            # Calculate drag coefficient
-            cd = drag_coefficient(mach)
-            
-            # Calculate drag force: F_d = 0.5 * rho * v^2 * Cd * A
-            drag = 0.5 * density * velocity ** 2 * cd * reference_area
-            
-            # Return drag force in the opposite direction of velocity
-            return -math.copysign(drag, velocity)
-        
-        # Differential equations for the rocket's motion
-        def dynamics(t, y):
-            # y = [altitude, velocity]
-            altitude, velocity = y
-            
-            # Current mass and thrust
-            mass = mass_function(t)
-            thrust = thrust_function(t)
-            
-            # Gravitational acceleration (decreases with altitude)
-            r_earth = 6371000  # m, Earth radius
-            gravity = self.g0 * (r_earth / (r_earth + altitude)) ** 2
-            
-            # Calculate drag
-            drag = drag_force(altitude, velocity)
-            
-            # Acceleration
-            acceleration = (thrust + drag) / mass - gravity
-            
-            return [velocity, acceleration]
+        params = self._trajectory_params()
         
         # Initial conditions
         y0 = [initial_altitude, initial_velocity]
@@ -275,81 +777,59 @@ class RocketPerformanceAnalyzer:
         t_span = (0, max_time)
         
         # Event function to detect apogee (maximum altitude)
-        def apogee_event(t, y):
+        def apogee_event(t, y, *args):
             return y[1]  # velocity = 0 at apogee
         
         apogee_event.terminal = False  # Don't terminate the simulation at apogee
         apogee_event.direction = -1  # Only detect when velocity changes from positive to negative
         
         # Solve the differential equations
+        # LSODA switches between stiff and non-stiff methods and takes large
+        # steps through the coast phase; samples land directly on t_eval
         solution = solve_ivp(
-            dynamics, 
+            _dynamics, 
             t_span, 
             y0, 
-            method='RK45', 
+            method='LSODA', 
+            t_eval=np.linspace(0, max_time, TRAJECTORY_SAMPLES),
             events=apogee_event,
-            max_step=1.0
+            jac=_jacobian,
+            rtol=1e-6,
+            args=params
         )
         
-        # Extract results
-        time = solution.t
-        altitude = solution.y[0]
-        velocity = solution.y[1]
-        
-        # Calculate acceleration, mach number, dynamic pressure, etc.
-        acceleration = np.zeros_like(time)
-        mach = np.zeros_like(time)
-        dynamic_pressure = np.zeros_like(time)
-        thrust = np.zeros_like(time)
-        mass = np.zeros_like(time)
-        drag = np.zeros_like(time)
-        
-        for i, t in enumerate(time):
-            # Current mass and thrust
-            mass[i] = mass_function(t)
-            thrust[i] = thrust_function(t)
-            
-            # Calculate drag
-            drag[i] = drag_force(altitude[i], velocity[i])
-            
-            # Gravitational acceleration
-            r_earth = 6371000  # m
-            gravity = self.g0 * (r_earth / (r_earth + altitude[i])) ** 2
-            
-            # Calculate acceleration
-            acceleration[i] = (thrust[i] + drag[i]) / mass[i] - gravity
-            
-            # Get atmospheric properties
-            _, density, temperature = atmospheric_properties(altitude[i])
-            
-            # Calculate Mach number
-            speed_of_sound = math.sqrt(1.4 * self.R_air * temperature)
-            mach[i] = abs(velocity[i]) / speed_of_sound if speed_of_sound > 0 else 0
-            
-            # Calculate dynamic pressure: q = 0.5 * rho * v^2
-            dynamic_pressure[i] = 0.5 * density * velocity[i] ** 2
+        # Extract results (integration ran in float64; downcast only the
+        # stored samples)
+        time = solution.t.astype(TRAJECTORY_DTYPE)
+        altitude = solution.y[0].astype(TRAJECTORY_DTYPE)
+        velocity = solution.y[1].astype(TRAJECTORY_DTYPE)
+        
+        # Calculate acceleration, mach number, dynamic pressure, etc. over all
+        # solver time steps at once
+        states = _trajectory_quantities(time, altitude, velocity, *params)
+        mass, thrust, drag, acceleration, mach, dynamic_pressure = states
         
         # Find apogee (maximum altitude)
         max_altitude_idx = np.argmax(altitude)
-        apogee = altitude[max_altitude_idx]
-        apogee_time = time[max_altitude_idx]
+        apogee = float(altitude[max_altitude_idx])
+        apogee_time = float(time[max_altitude_idx])
         
         # Find maximum velocity
         max_velocity_idx = np.argmax(np.abs(velocity))
-        max_velocity = velocity[max_velocity_idx]
-        max_velocity_time = time[max_velocity_idx]
+        max_velocity = float(velocity[max_velocity_idx])
+        max_velocity_time = float(time[max_velocity_idx])
         
         # Find maximum acceleration
         max_accel_idx = np.argmax(np.abs(acceleration))
-        max_acceleration = acceleration[max_accel_idx]
-        max_accel_time = time[max_accel_idx]
+        max_acceleration = float(acceleration[max_accel_idx])
+        max_accel_time = float(time[max_accel_idx])
         
         # Find maximum dynamic pressure (Max Q)
         max_q_idx = np.argmax(dynamic_pressure)
-        max_q = dynamic_pressure[max_q_idx]
-        max_q_time = time[max_q_idx]
+        max_q = float(dynamic_pressure[max_q_idx])
+        max_q_time = float(time[max_q_idx])
         
-        # Store trajectory data
+        # Store trajectory data (float32 arrays, Python float summary values)
         trajectory = {
             "time": time,
             "altitude": altitude,
@@ -389,7 +869,7 @@ class RocketPerformanceAnalyzer:
         current_payload = 50  # kg
         original_dry_mass = self.dry_mass
         
-        # Define step sizes for binary search
+        # Initial payload increment and search resolution
         step = 25  # kg
         min_step = 0.1  # kg
         
@@ -411,39 +891,75 @@ class RocketPerformanceAnalyzer:
         if altitude_range is None:
             altitude_range = target_altitude * 0.05  # 5% of target altitude
         
-        # Binary search for maximum payload
-        while step >= min_step:
-            # Increase payload
-            test_payload = current_payload + step
-            self.dry_mass = original_dry_mass - current_payload + test_payload
+        # Apogee decreases monotonically with payload. Bracket the payload
+        # at which it crosses the target with one expanding sweep evaluated
+        # in parallel, then converge on the crossing with Brent's method.
+        # Every reported altitude comes from the adaptive trajectory solver;
+        # the sweep only brackets.
+        def adaptive_apogee(payload):
+            self.dry_mass = original_dry_mass - current_payload + payload
+            return self.analyze_trajectory()["apogee"]
+        
+        feasible_payload = current_payload
+        feasible_altitude = current_altitude
+        infeasible_payload = None
+        
+        try:
+            if current_altitude >= target_altitude:
+                # Expanding sweep: double the payload increment
+                payloads = current_payload + step * 2.0 ** np.arange(PAYLOAD_BATCH_SIZE)
+                dry_masses = original_dry_mass - current_payload + payloads
+                if NUMBA_AVAILABLE:
+                    # Compiled fixed-step integrations spread across threads
+                    apogees = _batch_apogees(dry_masses, 500.0, BATCH_TIME_STEP,
+                                             *self._trajectory_params())
+                else:
+                    with ProcessPoolExecutor() as executor:
+                        apogees = np.array(list(executor.map(_apogee_for_dry_mass,
+                                                             itertools.repeat(self), dry_masses)))
+                
+                # First candidate that misses the target altitude
+                below = apogees < target_altitude
+                first_miss = int(np.argmax(below)) if below.any() else len(payloads)
+                if first_miss < len(payloads):
+                    infeasible_payload = payloads[first_miss]
+                
+                # Confirm the heaviest sweep candidate that reaches the target
+                # with the adaptive solver, stepping back toward the initial
+                # payload while it misses
+                for index in range(first_miss - 1, -1, -1):
+                    altitude = adaptive_apogee(payloads[index])
+                    if altitude >= target_altitude:
+                        feasible_payload, feasible_altitude = payloads[index], altitude
+                        break
+                    infeasible_payload = payloads[index]
             
-            # Analyze trajectory with new payload
-            trajectory = self.analyze_trajectory()
-            test_altitude = trajectory["apogee"]
+            within_range = not maximize_payload and abs(feasible_altitude - target_altitude) <= altitude_range
             
-            # Check if payload change is acceptable
-            if maximize_payload:
-                if test_altitude >= target_altitude:
-                    # Can increase payload
-                    current_payload = test_payload
-                    current_altitude = test_altitude
-                else:
-                    # Too heavy, reduce step size
-                    step /= 2
-            else:
-                # Trying to hit a specific target altitude
-                if abs(test_altitude - target_altitude) <= altitude_range:
-                    # Within acceptable range
-                    current_payload = test_payload
-                    current_altitude = test_altitude
-                    break
-                elif test_altitude > target_altitude:
-                    # Too light, add more payload
-                    current_payload = test_payload
-                    current_altitude = test_altitude
-                else:
-                    # Too heavy, reduce step size
-                    step /= 2
+            if infeasible_payload is not None and not within_range:
+                # Heaviest payload seen that still reaches the target
+                best = [feasible_payload, feasible_altitude]
+                
+                def altitude_margin(payload):
+                    apogee = adaptive_apogee(payload)
+                    if apogee >= target_altitude and payload > best[0]:
+                        best[0], best[1] = payload, apogee
+                    return apogee - target_altitude
+                
+                try:
+                    brentq(altitude_margin, feasible_payload, infeasible_payload, xtol=min_step)
+                except ValueError:
+                    # The infeasible end comes from the fixed-step sweep; if the
+                    # adaptive solver reaches the target there too, keep the
+                    # confirmed feasible end
+                    pass
+                
+                feasible_payload, feasible_altitude = best
+        finally:
+            self.dry_mass = original_dry_mass
+        
+        current_payload = float(feasible_payload)
+        current_altitude = float(feasible_altitude)
         
         # Reset dry mass to original value
         self.dry_mass = original_dry_mass
@@ -458,189 +974,194 @@ class RocketPerformanceAnalyzer:
         
         return payload_info
     
-    def generate_performance_graphs(self, output_dir):
+    def generate_performance_graphs(self, output_dir, dpi=DEFAULT_GRAPH_DPI, rasterized=True,
+                                    compress_level=DEFAULT_PNG_COMPRESS_LEVEL,
+                                    workers=GRAPH_WORKERS):
         """
         Generate comprehensive performance graphs for flow rates, pressures, velocities, 
         and trajectory analysis.
         
         Args:
             output_dir: Directory to save generated graphs
+            dpi: Resolution of the saved PNG files
+            rasterized: Whether dense line plots are rasterized when rendered
+            compress_level: zlib compression level (0-9) of the saved PNG files;
+                use 6 or higher for final report output
+            workers: Number of worker processes rendering the graph groups;
+                1 (default) renders everything in this process
             
         Returns:
             List of generated graph filenames
         """
         os.makedirs(output_dir, exist_ok=True)
-        generated_files = []
+        
+        # Nozzle flow profile shared by the flow graphs and the dashboard
+        nozzle_profile = self._compute_nozzle_profile() if self.flow_properties else None
+        
+        # Each graph group draws its own figures into separate files, so the
+        # groups can be rendered on pickled copies of the analyzer when a
+        # process pool is requested
+        tasks = []
         
         # 1. Flow Property Analysis
         if self.flow_properties:
-            f1 = self._generate_flow_property_graphs(output_dir)
-            generated_files.extend(f1)
+            tasks.append(("_generate_flow_property_graphs", (output_dir, dpi, rasterized),
+                          {"nozzle_profile": nozzle_profile}))
         
         # 2. Trajectory Analysis
         if self.trajectory_data:
-            f2 = self._generate_trajectory_graphs(output_dir)
-            generated_files.extend(f2)
+            tasks.append(("_generate_trajectory_graphs", (output_dir, dpi, rasterized), {}))
         
         # 3. Pressure Ratio Analysis
-        f3 = self._generate_pressure_ratio_graphs(output_dir)
-        generated_files.extend(f3)
+        tasks.append(("_generate_pressure_ratio_graphs", (output_dir, dpi), {}))
         
         # 4. Engine Performance Analysis
-        f4 = self._generate_engine_performance_graphs(output_dir)
-        generated_files.extend(f4)
+        tasks.append(("_generate_engine_performance_graphs", (output_dir, dpi, rasterized), {}))
         
         # 5. Combined Performance Dashboard
-        dashboard_file = self._generate_performance_dashboard(output_dir)
-        generated_files.append(dashboard_file)
+        tasks.append(("_generate_performance_dashboard", (output_dir, dpi),
+                      {"nozzle_profile": nozzle_profile}))
+        
+        for _, _, kwargs in tasks:
+            kwargs["compress_level"] = compress_level
+        
+        workers = min(workers, len(tasks), os.cpu_count() or 1)
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_render_graph_group, self, name, args, kwargs)
+                           for name, args, kwargs in tasks]
+                groups = [future.result() for future in futures]
+        else:
+            groups = [_render_graph_group(self, name, args, kwargs) for name, args, kwargs in tasks]
+        
+        generated_files = [filename for group in groups for filename in group]
         
         return generated_files
         
-    def _generate_flow_property_graphs(self, output_dir):
-        """Generate detailed graphs of flow properties."""
-        generated_files = []
+    def _compute_nozzle_profile(self, num_points=100):
+        """
+        Compute the isentropic flow profile along the engine.
         
-        # Create a pressure profile along the engine
-        # First, create more data points along the nozzle for smoother curve
-        locations = np.linspace(0, 1, 100)  # Normalized distance along nozzle
+        Args:
+            num_points: Number of stations along the nozzle
+            
+        Returns:
+            Dictionary of arrays over the normalized nozzle length: locations,
+            diameters, mach, pressure, temperature, velocity and density
+        """
+        locations = np.linspace(0, 1, num_points)  # Normalized distance along nozzle
         
-        # Nozzle geometry (simplified)
+        # Nozzle geometry (simplified): chamber, linear convergent section,
+        # throat region and linear divergent section
         chamber_diameter = 2 * self.throat_diameter  # m
-        diameters = []
-        pressures = []
-        velocities = []
-        mach_numbers = []
-        densities = []
-        temperatures = []
+        diameters = np.select(
+            [locations < 0.2, locations < 0.3, locations < 0.35],
+            [chamber_diameter,
+             chamber_diameter - (chamber_diameter - self.throat_diameter) * (locations - 0.2) / 0.1,
+             self.throat_diameter],
+            default=self.throat_diameter + (self.exit_diameter - self.throat_diameter) * (locations - 0.35) / 0.65
+        )
         
-        gamma = self.gamma_steam
+        c = _isentropic_constants(self.gamma_steam, self.R_steam)
         p0 = self.chamber_pressure
         T0 = self.chamber_temperature
         
-        for x in locations:
-            # Geometry: simple parabolic nozzle profile
-            if x < 0.2:  # Chamber
-                diameter = chamber_diameter
-            elif x < 0.3:  # Convergent section
-                # Linear transition to throat
-                diameter = chamber_diameter - (chamber_diameter - self.throat_diameter) * (x - 0.2) / 0.1
-            elif x < 0.35:  # Throat region
-                diameter = self.throat_diameter
-            else:  # Divergent section
-                # Linear transition to exit
-                diameter = self.throat_diameter + (self.exit_diameter - self.throat_diameter) * (x - 0.35) / 0.65
-            
-            diameters.append(diameter)
-            
-            # Calculate area ratio
-            area = math.pi * (diameter/2)**2
-            area_ratio = area / (math.pi * (self.throat_diameter/2)**2)
-            
-            # Approximate Mach number based on area ratio
-            # This is an implicit relation, using approximate solution
-            if area_ratio < 1.0:  # Subsonic
-                # For convergent section, use subsonic relations
-                # M = sqrt((2/(gamma-1))*((A_t/A)^((gamma-1)/gamma)*(1+(gamma-1)/2)^((gamma+1)/(gamma-1)) - 1))
-                mach = 0
-                try:
-                    term = (1/area_ratio)**((gamma-1)/gamma) * ((gamma+1)/2)**((gamma+1)/(gamma-1))
-                    if term > 1:
-                        mach = math.sqrt((2/(gamma-1)) * (term - 1))
-                except:
-                    mach = 0.1  # Fallback for numerical issues
-            else:  # Supersonic
-                # For divergent section, use supersonic relations
-                # Using Newton-Raphson to solve for Mach number
-                # This is a simplified implementation
-                mach = 2.0  # Initial guess
-                for _ in range(10):  # Max iterations
-                    f = lambda M: area_ratio - (1/M) * ((2+(gamma-1)*M*M)/(gamma+1))**((gamma+1)/(2*(gamma-1)))
-                    df = lambda M: -((2+(gamma-1)*M*M)/(gamma+1))**((gamma+1)/(2*(gamma-1))) * (1/M**2) + \
-                          (1/M) * ((gamma+1)/(2*(gamma-1))) * ((2+(gamma-1)*M*M)/(gamma+1))**(((gamma+1)/(2*(gamma-1)))-1) * \
-                          (2*(gamma-1))/(gamma+1)
-                    
-                    if df(mach) != 0:
-                        mach = mach - f(mach) / df(mach)
-            
-            # Calculate pressure, temperature
-            if mach >= 0:
-                pressure = p0 / ((1 + (gamma-1)/2 * mach**2)**(gamma/(gamma-1)))
-                temperature = T0 / (1 + (gamma-1)/2 * mach**2)
-                
-                # Calculate velocity
-                a = math.sqrt(gamma * self.R_steam * temperature)  # Speed of sound
-                velocity = mach * a
-                
-                # Calculate density
-                density = pressure / (self.R_steam * temperature)
-            else:
-                # Fallback values
-                pressure = p0
-                temperature = T0
-                velocity = 0
-                density = p0 / (self.R_steam * T0)
-            
-            pressures.append(pressure)
-            velocities.append(velocity)
-            mach_numbers.append(mach)
-            densities.append(density)
-            temperatures.append(temperature)
+        # Calculate area ratio
+        area_ratios = (diameters / self.throat_diameter) ** 2
+        subsonic = locations < 0.3  # Upstream of the throat
+        
+        # Mach number from the area ratio, inverting the area-Mach relation
+        # by interpolation in its precomputed tables: the subsonic branch
+        # upstream of the throat, supersonic downstream
+        subsonic_mach = np.interp(area_ratios, *_area_mach_table(self.gamma_steam, False))
+        supersonic_mach = np.interp(area_ratios, *_area_mach_table(self.gamma_steam, True))
+        mach_numbers = np.where(subsonic, subsonic_mach, supersonic_mach)
+        
+        # Calculate pressure, temperature, velocity and density
+        stagnation_ratio = 1 + c.half_gm1 * mach_numbers * mach_numbers
+        temperatures = T0 / stagnation_ratio
+        pressures = p0 * np.power(stagnation_ratio, -c.gexp)
+        velocities = mach_numbers * np.sqrt(c.gamma_R * temperatures)
+        densities = pressures / (self.R_steam * temperatures)
+        
+        return {
+            "locations": locations,
+            "diameters": diameters,
+            "mach": mach_numbers,
+            "pressure": pressures,
+            "temperature": temperatures,
+            "velocity": velocities,
+            "density": densities
+        }
+        
+    def _generate_flow_property_graphs(self, output_dir, dpi=DEFAULT_GRAPH_DPI, rasterized=True,
+                                       nozzle_profile=None, compress_level=DEFAULT_PNG_COMPRESS_LEVEL):
+        """Generate detailed graphs of flow properties."""
+        generated_files = []
+        
+        if nozzle_profile is None:
+            nozzle_profile = self._compute_nozzle_profile()
+        
+        locations = nozzle_profile["locations"]
+        diameters = nozzle_profile["diameters"]
+        mach_numbers = nozzle_profile["mach"]
+        pressures = nozzle_profile["pressure"]
+        temperatures = nozzle_profile["temperature"]
+        velocities = nozzle_profile["velocity"]
+        densities = nozzle_profile["density"]
         
         # Create a nozzle profile figure
-        fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(10, 15))
+        fig = _graph_figure((10, 15))
+        ax1, ax2, ax3 = fig.subplots(3, 1)
         
         # 1. Nozzle geometry and pressure
         ax1b = ax1.twinx()
         
-        # Nozzle outline (top half)
-        upper_wall = [(x, d/2) for x, d in zip(locations, diameters)]
-        # Nozzle outline (bottom half)
-        lower_wall = [(x, -d/2) for x, d in zip(locations, diameters)]
-        
-        x_top, y_top = zip(*upper_wall)
-        x_bottom, y_bottom = zip(*lower_wall)
+        # Nozzle outline (top and bottom halves)
+        radii = diameters / 2
         
-        ax1.fill_between(x_top, y_top, y_bottom, color='lightgray', alpha=0.5)
-        ax1.plot(x_top, y_top, 'k-', linewidth=2)
-        ax1.plot(x_bottom, y_bottom, 'k-', linewidth=2)
+        ax1.fill_between(locations, radii, -radii, color='lightgray', alpha=0.5, rasterized=rasterized)
+        ax1.plot(locations, radii, 'k-', linewidth=2, rasterized=rasterized)
+        ax1.plot(locations, -radii, 'k-', linewidth=2, rasterized=rasterized)
         ax1.set_ylabel('Nozzle Radius (m)')
         ax1.set_title('Nozzle Geometry and Pressure Profile')
         
         # Pressure
-        ax1b.plot(locations, np.array(pressures)/1e6, 'r-', linewidth=2)
+        ax1b.plot(locations, pressures/1e6, 'r-', linewidth=2, rasterized=rasterized)
         ax1b.set_ylabel('Pressure (MPa)')
         
         # 2. Velocity and Mach number
-        ax2.plot(locations, velocities, 'b-', linewidth=2)
+        ax2.plot(locations, velocities, 'b-', linewidth=2, rasterized=rasterized)
         ax2.set_ylabel('Velocity (m/s)')
         
         ax2b = ax2.twinx()
-        ax2b.plot(locations, mach_numbers, 'g--', linewidth=2)
+        ax2b.plot(locations, mach_numbers, 'g--', linewidth=2, rasterized=rasterized)
         ax2b.set_ylabel('Mach Number')
         ax2.set_title('Velocity and Mach Number Profile')
         
         # 3. Temperature and density
-        ax3.plot(locations, temperatures, 'r-', linewidth=2)
+        ax3.plot(locations, temperatures, 'r-', linewidth=2, rasterized=rasterized)
         ax3.set_ylabel('Temperature (K)')
         ax3.set_xlabel('Normalized Distance Along Nozzle')
         
         ax3b = ax3.twinx()
-        ax3b.plot(locations, np.array(densities), 'b--', linewidth=2)
+        ax3b.plot(locations, densities, 'b--', linewidth=2, rasterized=rasterized)
         ax3b.set_ylabel('Density (kg/m³)')
         ax3.set_title('Temperature and Density Profile')
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save figure
         nozzle_file = os.path.join(output_dir, 'nozzle_flow_analysis.png')
-        plt.savefig(nozzle_file, dpi=300, bbox_inches='tight')
-        plt.close(fig)
+        fig.savefig(nozzle_file, dpi=dpi,
+                    pil_kwargs={'compress_level': compress_level, 'optimize': False})
         
         generated_files.append(nozzle_file)
         
         return generated_files
 
-    def _generate_trajectory_graphs(self, output_dir):
+    def _generate_trajectory_graphs(self, output_dir, dpi=DEFAULT_GRAPH_DPI, rasterized=True,
+                                    compress_level=DEFAULT_PNG_COMPRESS_LEVEL):
         """Generate trajectory analysis graphs."""
         generated_files = []
         
@@ -657,10 +1178,11 @@ class RocketPerformanceAnalyzer:
         mass = self.trajectory_data["mass"]
         
         # Figure 1: Altitude, velocity, acceleration
-        fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(10, 15))
+        fig = _graph_figure((10, 15))
+        ax1, ax2, ax3 = fig.subplots(3, 1)
         
         # Altitude
-        ax1.plot(time, altitude/1000, 'b-', linewidth=2)
+        ax1.plot(time, altitude/1000, 'b-', linewidth=2, rasterized=rasterized)
         ax1.set_ylabel('Altitude (km)')
         ax1.set_title('Rocket Trajectory - Altitude')
         ax1.grid(True)
@@ -675,7 +1197,7 @@ class RocketPerformanceAnalyzer:
                      arrowprops=dict(facecolor='black', shrink=0.05, width=1.5))
         
         # Velocity
-        ax2.plot(time, velocity, 'g-', linewidth=2)
+        ax2.plot(time, velocity, 'g-', linewidth=2, rasterized=rasterized)
         ax2.set_ylabel('Velocity (m/s)')
         ax2.set_title('Rocket Trajectory - Velocity')
         ax2.grid(True)
@@ -690,7 +1212,7 @@ class RocketPerformanceAnalyzer:
                      arrowprops=dict(facecolor='black', shrink=0.05, width=1.5))
         
         # Acceleration
-        ax3.plot(time, acceleration, 'r-', linewidth=2)
+        ax3.plot(time, acceleration, 'r-', linewidth=2, rasterized=rasterized)
         ax3.set_ylabel('Acceleration (m/s²)')
         ax3.set_xlabel('Time (s)')
         ax3.set_title('Rocket Trajectory - Acceleration')
@@ -705,20 +1227,21 @@ class RocketPerformanceAnalyzer:
                      xytext=(max_acc_time + 5, max_acc * 0.9),
                      arrowprops=dict(facecolor='black', shrink=0.05, width=1.5))
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save figure
         trajectory_file = os.path.join(output_dir, 'trajectory_analysis.png')
-        plt.savefig(trajectory_file, dpi=300, bbox_inches='tight')
-        plt.close(fig)
+        fig.savefig(trajectory_file, dpi=dpi,
+                    pil_kwargs={'compress_level': compress_level, 'optimize': False})
         
         generated_files.append(trajectory_file)
         
         # Figure 2: Mach number, dynamic pressure, mass
-        fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(10, 15))
+        fig = _graph_figure((10, 15))
+        ax1, ax2, ax3 = fig.subplots(3, 1)
         
         # Mach number
-        ax1.plot(time, mach, 'b-', linewidth=2)
+        ax1.plot(time, mach, 'b-', linewidth=2, rasterized=rasterized)
         ax1.set_ylabel('Mach Number')
         ax1.set_title('Rocket Trajectory - Mach Number')
         ax1.grid(True)
@@ -728,7 +1251,7 @@ class RocketPerformanceAnalyzer:
         ax1.annotate('Mach 1', xy=(time[-1]*0.95, 1.05), color='r')
         
         # Dynamic pressure
-        ax2.plot(time, q/1000, 'g-', linewidth=2)  # kPa
+        ax2.plot(time, q/1000, 'g-', linewidth=2, rasterized=rasterized)  # kPa
         ax2.set_ylabel('Dynamic Pressure (kPa)')
         ax2.set_title('Rocket Trajectory - Dynamic Pressure')
         ax2.grid(True)
@@ -743,7 +1266,7 @@ class RocketPerformanceAnalyzer:
                      arrowprops=dict(facecolor='black', shrink=0.05, width=1.5))
         
         # Mass
-        ax3.plot(time, mass, 'r-', linewidth=2)
+        ax3.plot(time, mass, 'r-', linewidth=2, rasterized=rasterized)
         ax3.set_ylabel('Mass (kg)')
         ax3.set_xlabel('Time (s)')
         ax3.set_title('Rocket Trajectory - Mass')
@@ -757,18 +1280,19 @@ class RocketPerformanceAnalyzer:
                          xytext=(self.burn_time + 5, min(mass) + (max(mass) - min(mass))*0.5),
                          arrowprops=dict(facecolor='black', shrink=0.05, width=1.5))
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save figure
         trajectory_file2 = os.path.join(output_dir, 'trajectory_analysis_2.png')
-        plt.savefig(trajectory_file2, dpi=300, bbox_inches='tight')
-        plt.close(fig)
+        fig.savefig(trajectory_file2, dpi=dpi,
+                    pil_kwargs={'compress_level': compress_level, 'optimize': False})
         
         generated_files.append(trajectory_file2)
         
         return generated_files
     
-    def _generate_pressure_ratio_graphs(self, output_dir):
+    def _generate_pressure_ratio_graphs(self, output_dir, dpi=DEFAULT_GRAPH_DPI,
+                                        compress_level=DEFAULT_PNG_COMPRESS_LEVEL):
         """Generate pressure ratio analysis graphs."""
         generated_files = []
         
@@ -776,60 +1300,53 @@ class RocketPerformanceAnalyzer:
         # This shows how the nozzle expansion ratio affects the pressure ratio
         # and how this relates to different altitudes
         
-        fig, ax = plt.subplots(figsize=(10, 8))
-        
-        # Range of expansion ratios to explore
-        expansion_ratios = np.linspace(1, 30, 100)
+        fig = _graph_figure((10, 8))
+        ax = fig.subplots()
         
         # Optimal expansion ratio for different altitudes
-        altitudes = [0, 5000, 10000, 15000, 20000, 30000]  # meters
+        altitudes = (0, 5000, 10000, 15000, 20000, 30000)  # meters
         altitude_labels = ['Sea Level', '5 km', '10 km', '15 km', '20 km', '30 km']
         
         # Calculate pressure ratio for each expansion ratio
         gamma = self.gamma_steam
         
-        # Function to calculate exit pressure ratio from expansion ratio
-        def pressure_ratio(expansion_ratio, gamma=1.3):
-            # p_e/p_0 = (1/ER)^gamma
-            # This is a simplified approximation
-            return (1 / expansion_ratio) ** gamma
-        
-        # Ideal pressure ratio curve (perfect expansion)
-        pr_ideal = np.array([pressure_ratio(er) for er in expansion_ratios])
+        # Ideal pressure ratio curve (perfect expansion) over the range of
+        # expansion ratios to explore
+        expansion_ratios, pr_ideal = _ideal_pressure_ratio_curve(gamma)
         
         # Plot the ideal curve
-        ax.plot(expansion_ratios, pr_ideal, 'k-', linewidth=2, label='Ideal Pressure Ratio')
+        ideal_line, = ax.plot(expansion_ratios, pr_ideal, 'k-', linewidth=2, label='Ideal Pressure Ratio')
         
-        # Calculate atmospheric pressure at different altitudes
-        def pressure_at_altitude(altitude):
-            # Using simplified exponential model
-            h_p = 7500  # m, pressure scale height
-            return self.p0 * math.exp(-altitude / h_p)
+        # Ambient pressure ratio at each altitude and the expansion ratio
+        # that matches it
+        _, p_ratios, optimal_ers = _altitude_pressure_ratios(altitudes, self.p0,
+                                                             self.chamber_pressure, gamma)
         
-        # For each altitude, plot the ambient pressure ratio
+        # Ambient pressure ratio of each altitude as one collection of
+        # full-width horizontal lines (x in axes coordinates, y in data)
         colors = ['r', 'g', 'b', 'c', 'm', 'y']
-        for i, altitude in enumerate(altitudes):
-            p_ambient = pressure_at_altitude(altitude)
-            p_ratio = p_ambient / self.chamber_pressure
-            
-            # Plot horizontal line for this altitude
-            ax.axhline(y=p_ratio, color=colors[i], linestyle='--', alpha=0.7,
-                       label=f'{altitude_labels[i]} (P_ratio = {p_ratio:.6f})')
-            
-            # Find optimal expansion ratio for this altitude
-            optimal_er = 1/p_ratio**(1/gamma)  # Simplified approximation
+        segments = np.stack([np.column_stack([np.zeros_like(p_ratios), p_ratios]),
+                             np.column_stack([np.ones_like(p_ratios), p_ratios])], axis=1)
+        ax.add_collection(LineCollection(segments, colors=colors, linestyles='--', alpha=0.7,
+                                         transform=ax.get_yaxis_transform()),
+                          autolim=False)
             
-            # Mark the intersection of altitude line with ideal curve
-            ax.plot(optimal_er, p_ratio, 'o', color=colors[i], markersize=8)
-            ax.annotate(f'ER = {optimal_er:.1f}',
-                        xy=(optimal_er, p_ratio),
-                        xytext=(optimal_er + 1, p_ratio * 1.5),
-                        arrowprops=dict(facecolor=colors[i], shrink=0.05, width=1))
+        # Mark the intersection of each altitude line with the ideal curve
+        ax.scatter(optimal_ers, p_ratios, c=colors, s=64)
+
+        # Legend entries for the altitude lines, listing the optimal
+        # expansion ratio in place of per-point arrow annotations
+        altitude_handles = [
+            Line2D([], [], color=color, linestyle='--', alpha=0.7,
+                   label=f'{label}: P={p_ratio:.1e}, ER_opt={optimal_er:.1f}')
+            for color, label, p_ratio, optimal_er in zip(colors, altitude_labels, p_ratios, optimal_ers)
+        ]
             
         # Add current rocket expansion ratio
         current_er = self.expansion_ratio
-        current_pr = pressure_ratio(current_er)
-        ax.plot(current_er, current_pr, 'ko', markersize=10, label=f'Current Design (ER = {current_er:.2f})')
+        current_pr = _pressure_ratio_curve(np.array([current_er]), gamma)[0]
+        current_marker, = ax.plot(current_er, current_pr, 'ko', markersize=10,
+                                  label=f'Current Design (ER = {current_er:.2f})')
         
         # Set logarithmic scale for y-axis (pressure ratios can be very small)
         ax.set_yscale('log')
@@ -841,50 +1358,39 @@ class RocketPerformanceAnalyzer:
         
         # Add grid and legend
         ax.grid(True, which='both', linestyle='--', alpha=0.7)
-        ax.legend(loc='best')
+        ax.legend(handles=[ideal_line, *altitude_handles, current_marker], loc='best')
         
         # Save figure
         pressure_ratio_file = os.path.join(output_dir, 'pressure_ratio_analysis.png')
-        plt.savefig(pressure_ratio_file, dpi=300, bbox_inches='tight')
-        plt.close(fig)
+        fig.savefig(pressure_ratio_file, dpi=dpi, bbox_inches='tight',
+                    pil_kwargs={'compress_level': compress_level, 'optimize': False})
         
         generated_files.append(pressure_ratio_file)
         
         return generated_files
 
-    def _generate_engine_performance_graphs(self, output_dir):
+    def _generate_engine_performance_graphs(self, output_dir, dpi=DEFAULT_GRAPH_DPI, rasterized=True,
+                                            compress_level=DEFAULT_PNG_COMPRESS_LEVEL):
         """Generate engine performance analysis graphs."""
         generated_files = []
         
         # Create a performance map showing how thrust and ISP vary with key parameters
         
         # 1. Thrust vs Chamber Pressure
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 12))
+        fig = _graph_figure((10, 12))
+        ax1, ax2 = fig.subplots(2, 1)
         
         # Range of chamber pressures to explore (MPa)
         pressures = np.linspace(1, 10, 20)  # 1-10 MPa
-        thrusts = []
-        isps = []
-        
-        # Calculate thrust and ISP for each pressure
-        orig_pressure = self.chamber_pressure
-        for p in pressures:
-            # Temporarily set new pressure
-            self.chamber_pressure = p * 1e6  # Convert to Pa
-            
-            # Recalculate flow properties
-            self.analyze_flow_properties()
-            
-            # Store results
-            thrusts.append(self.performance_metrics["thrust"])
-            isps.append(self.performance_metrics["specific_impulse"])
         
-        # Restore original pressure
-        self.chamber_pressure = orig_pressure
-        self.analyze_flow_properties()
+        # Calculate thrust and ISP for all pressures at once
+        thrusts, isps = _flow_properties_vectorized(
+            pressures * 1e6, self.chamber_temperature, self.throat_area, self.exit_area,
+            self.gamma_steam, self.R_steam, self.p0, self.g0
+        )
         
         # Plot thrust vs pressure
-        ax1.plot(pressures, thrusts, 'b-', linewidth=2)
+        ax1.plot(pressures, thrusts, 'b-', linewidth=2, rasterized=rasterized)
         ax1.set_xlabel('Chamber Pressure (MPa)')
         ax1.set_ylabel('Thrust (N)')
         ax1.set_title('Thrust vs Chamber Pressure')
@@ -900,7 +1406,7 @@ class RocketPerformanceAnalyzer:
                     arrowprops=dict(facecolor='black', shrink=0.05, width=1.5))
         
         # Plot ISP vs pressure
-        ax2.plot(pressures, isps, 'g-', linewidth=2)
+        ax2.plot(pressures, isps, 'g-', linewidth=2, rasterized=rasterized)
         ax2.set_xlabel('Chamber Pressure (MPa)')
         ax2.set_ylabel('Specific Impulse (s)')
         ax2.set_title('Specific Impulse vs Chamber Pressure')
@@ -914,49 +1420,31 @@ class RocketPerformanceAnalyzer:
                     xytext=(current_pressure * 0.8, current_isp * 0.9),
                     arrowprops=dict(facecolor='black', shrink=0.05, width=1.5))
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save figure
         engine_perf_file = os.path.join(output_dir, 'engine_performance_pressure.png')
-        plt.savefig(engine_perf_file, dpi=300, bbox_inches='tight')
-        plt.close(fig)
+        fig.savefig(engine_perf_file, dpi=dpi, bbox_inches='tight',
+                    pil_kwargs={'compress_level': compress_level, 'optimize': False})
         
         generated_files.append(engine_perf_file)
         
         # 2. Performance vs Expansion Ratio
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 12))
+        fig = _graph_figure((10, 12))
+        ax1, ax2 = fig.subplots(2, 1)
         
         # Range of expansion ratios to explore
         exp_ratios = np.linspace(2, 20, 20)
-        er_thrusts = []
-        er_isps = []
-        
-        # Calculate thrust and ISP for each expansion ratio
-        orig_exit_area = self.exit_area
         orig_expansion_ratio = self.expansion_ratio
         
-        for er in exp_ratios:
-            # Calculate new exit area
-            new_exit_area = self.throat_area * er
-            
-            # Temporarily set new exit area and expansion ratio
-            self.exit_area = new_exit_area
-            self.expansion_ratio = er
-            
-            # Recalculate flow properties
-            self.analyze_flow_properties()
-            
-            # Store results
-            er_thrusts.append(self.performance_metrics["thrust"])
-            er_isps.append(self.performance_metrics["specific_impulse"])
-        
-        # Restore original values
-        self.exit_area = orig_exit_area
-        self.expansion_ratio = orig_expansion_ratio
-        self.analyze_flow_properties()
+        # Calculate thrust and ISP for all expansion ratios at once
+        er_thrusts, er_isps = _flow_properties_vectorized(
+            self.chamber_pressure, self.chamber_temperature, self.throat_area,
+            self.throat_area * exp_ratios, self.gamma_steam, self.R_steam, self.p0, self.g0
+        )
         
         # Plot thrust vs expansion ratio
-        ax1.plot(exp_ratios, er_thrusts, 'b-', linewidth=2)
+        ax1.plot(exp_ratios, er_thrusts, 'b-', linewidth=2, rasterized=rasterized)
         ax1.set_xlabel('Expansion Ratio')
         ax1.set_ylabel('Thrust (N)')
         ax1.set_title('Thrust vs Expansion Ratio')
@@ -970,7 +1458,7 @@ class RocketPerformanceAnalyzer:
                     arrowprops=dict(facecolor='black', shrink=0.05, width=1.5))
         
         # Plot ISP vs expansion ratio
-        ax2.plot(exp_ratios, er_isps, 'g-', linewidth=2)
+        ax2.plot(exp_ratios, er_isps, 'g-', linewidth=2, rasterized=rasterized)
         ax2.set_xlabel('Expansion Ratio')
         ax2.set_ylabel('Specific Impulse (s)')
         ax2.set_title('Specific Impulse vs Expansion Ratio')
@@ -983,21 +1471,22 @@ class RocketPerformanceAnalyzer:
                     xytext=(orig_expansion_ratio * 0.8, current_isp * 0.9),
                     arrowprops=dict(facecolor='black', shrink=0.05, width=1.5))
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save figure
         engine_perf_file2 = os.path.join(output_dir, 'engine_performance_expansion.png')
-        plt.savefig(engine_perf_file2, dpi=300, bbox_inches='tight')
-        plt.close(fig)
+        fig.savefig(engine_perf_file2, dpi=dpi, bbox_inches='tight',
+                    pil_kwargs={'compress_level': compress_level, 'optimize': False})
         
         generated_files.append(engine_perf_file2)
         
         return generated_files
     
-    def _generate_performance_dashboard(self, output_dir):
+    def _generate_performance_dashboard(self, output_dir, dpi=DEFAULT_GRAPH_DPI, nozzle_profile=None,
+                                        compress_level=DEFAULT_PNG_COMPRESS_LEVEL):
         """Generate a comprehensive performance dashboard with key metrics."""
         # Create a dashboard summary figure
-        fig = plt.figure(figsize=(12, 15))
+        fig = _graph_figure((12, 15))
         
         # Use GridSpec for complex layout
         gs = gridspec.GridSpec(4, 2, figure=fig)
@@ -1058,23 +1547,11 @@ class RocketPerformanceAnalyzer:
         ax_pressure = fig.add_subplot(gs[2, 1])
         # If we have flow property data, plot it
         if hasattr(self, 'flow_properties') and self.flow_properties:
-            # Simplified representation of pressure along nozzle
-            locations = np.linspace(0, 1, 100)  # Normalized distance
-            pressures = []
-            
-            # Generate a simplified pressure profile
-            chamber_p = self.chamber_pressure / 1e6  # MPa
-            throat_p = chamber_p * 0.5  # Approximate
-            exit_p = self.flow_properties.get("exit", {}).get("pressure", 0) / 1e6  # MPa
-            
-            for x in locations:
-                if x < 0.3:  # Chamber
-                    p = chamber_p
-                elif x < 0.35:  # Throat
-                    p = throat_p
-                else:  # Divergent section - linear decay
-                    p = throat_p - (throat_p - exit_p) * (x - 0.35) / 0.65
-                pressures.append(p)
+            # Reuse the nozzle flow profile computed for the flow graphs
+            if nozzle_profile is None:
+                nozzle_profile = self._compute_nozzle_profile()
+            locations = nozzle_profile["locations"]  # Normalized distance
+            pressures = nozzle_profile["pressure"] / 1e6  # MPa
             
             ax_pressure.plot(locations, pressures, 'r-', linewidth=2)
             ax_pressure.set_xlabel('Normalized Distance Along Engine')
@@ -1089,141 +1566,260 @@ class RocketPerformanceAnalyzer:
         ax_table = fig.add_subplot(gs[3, :])
         ax_table.axis('off')  # No axes for table
         
+        # Format all table values in one vectorized call
+        values = np.array([
+            self.chamber_pressure/1e6, self.chamber_temperature,
+            self.chamber_temperature - 273.15, self.flow_properties.get('mass_flow_rate', 0),
+            self.throat_diameter*1000, self.exit_diameter*1000, self.expansion_ratio,
+            thrust, isp, self.burn_time, self.propellant_mass, apogee/1000,
+            max_velocity, max_velocity/340
+        ], dtype=float)
+        formats = np.array(['%.2f', '%.1f', '%.1f', '%.3f', '%.1f', '%.1f', '%.2f',
+                            '%.1f', '%.1f', '%.1f', '%.1f', '%.2f', '%.1f', '%.1f'])
+        (chamber_pressure_str, chamber_temperature_str, chamber_celsius_str, mass_flow_str,
+         throat_str, exit_str, expansion_str, thrust_str, isp_str, burn_time_str,
+         propellant_str, apogee_str, velocity_str, mach_str) = np.char.mod(formats, values)
+        
         # Create table data
         table_data = [
             ['Parameter', 'Value', 'Units', 'Notes'],
-            ['Chamber Pressure', f"{self.chamber_pressure/1e6:.2f}", 'MPa', 'Design pressure'],
-            ['Chamber Temperature', f"{self.chamber_temperature:.1f}", 'K', f"{self.chamber_temperature-273.15:.1f}°C"],
-            ['Mass Flow Rate', f"{self.flow_properties.get('mass_flow_rate', 0):.3f}", 'kg/s', 'Propellant consumption'],
-            ['Throat Diameter', f"{self.throat_diameter*1000:.1f}", 'mm', 'Critical dimension'],
-            ['Exit Diameter', f"{self.exit_diameter*1000:.1f}", 'mm', 'Nozzle exit'],
-            ['Expansion Ratio', f"{self.expansion_ratio:.2f}", '', 'Area ratio (exit/throat)'],
-            ['Thrust', f"{thrust:.1f}", 'N', 'At sea level'],
-            ['Specific Impulse', f"{isp:.1f}", 's', 'Efficiency metric'],
-            ['Burn Time', f"{self.burn_time:.1f}", 's', 'Engine firing duration'],
-            ['Propellant Mass', f"{self.propellant_mass:.1f}", 'kg', 'Water/steam mass'],
-            ['Maximum Altitude', f"{apogee/1000:.2f}", 'km', 'Apogee'],
-            ['Maximum Velocity', f"{max_velocity:.1f}", 'm/s', f"Mach {max_velocity/340:.1f}"]
+            ['Chamber Pressure', chamber_pressure_str, 'MPa', 'Design pressure'],
+            ['Chamber Temperature', chamber_temperature_str, 'K', f"{chamber_celsius_str}°C"],
+            ['Mass Flow Rate', mass_flow_str, 'kg/s', 'Propellant consumption'],
+            ['Throat Diameter', throat_str, 'mm', 'Critical dimension'],
+            ['Exit Diameter', exit_str, 'mm', 'Nozzle exit'],
+            ['Expansion Ratio', expansion_str, '', 'Area ratio (exit/throat)'],
+            ['Thrust', thrust_str, 'N', 'At sea level'],
+            ['Specific Impulse', isp_str, 's', 'Efficiency metric'],
+            ['Burn Time', burn_time_str, 's', 'Engine firing duration'],
+            ['Propellant Mass', propellant_str, 'kg', 'Water/steam mass'],
+            ['Maximum Altitude', apogee_str, 'km', 'Apogee'],
+            ['Maximum Velocity', velocity_str, 'm/s', f"Mach {mach_str}"]
         ]
         
-        # Create the table
-        table = ax_table.table(
-            cellText=[row[1:3] for row in table_data[1:]],  # Just value and units
-            rowLabels=[row[0] for row in table_data[1:]],   # Parameters as row labels
-            colLabels=table_data[0][1:3],                   # Value and Units as column labels
-            loc='center',
-            cellLoc='center'
-        )
-        
-        # Style the table
-        table.auto_set_font_size(False)
-        table.set_fontsize(10)
-        table.scale(1, 1.5)  # Scale table for better readability
+        # Render the table as one fixed-width text block rather than a
+        # matplotlib table with an artist per cell
+        rows = [f"{name:<22}{value:>12}  {units:<7}{notes}"
+                for name, value, units, notes in table_data]
+        table_text = "\n".join([rows[0], "-" * max(map(len, rows))] + rows[1:])
+        ax_table.text(0.5, 0.5, table_text, family='monospace', fontsize=10,
+                      ha='center', va='center', multialignment='left',
+                      transform=ax_table.transAxes)
         
         # Add footer
         footer_text = "Generated by Two-Stage Space Vehicle Design Project"
         fig.text(0.5, 0.01, footer_text, ha='center', fontsize=10)
         
-        plt.tight_layout(rect=[0, 0.02, 1, 0.98])  # Adjust layout to make room for footer
+        fig.tight_layout(rect=[0, 0.02, 1, 0.98])  # Adjust layout to make room for footer
         
         # Save dashboard
         dashboard_file = os.path.join(output_dir, 'performance_dashboard.png')
-        plt.savefig(dashboard_file, dpi=300, bbox_inches='tight')
-        plt.close(fig)
+        fig.savefig(dashboard_file, dpi=dpi, bbox_inches='tight',
+                    pil_kwargs={'compress_level': compress_level, 'optimize': False})
         
         return dashboard_file
     
     def _draw_rocket_diagram(self, ax):
         """Draw a simplified diagram of the rocket on the given axes."""
-        # Get rocket dimensions
-        total_length = self.rocket_config["total_length"] / 1000  # m
-        max_diameter = self.rocket_config["max_diameter"] / 1000  # m
-        first_stage_ratio = self.rocket_config["first_stage_length_ratio"]
-        nose_cone_ratio = self.rocket_config["nose_cone_length_ratio"]
-        
-        # Simplified rocket shape
-        first_stage_length = total_length * first_stage_ratio
-        second_stage_length = total_length * (1 - first_stage_ratio - nose_cone_ratio)
-        nose_length = total_length * nose_cone_ratio
-        
-        # Center the rocket in the axes
-        x_start = 0
-        y_center = 0
-        radius = max_diameter / 2
-        
-        # Draw first stage
-        first_stage = plt.Rectangle((x_start, y_center - radius), 
-                                   first_stage_length, 2*radius,
-                                   fc='lightgray', ec='black')
-        ax.add_patch(first_stage)
-        
-        # Draw second stage
-        second_stage_radius = radius * 0.9
-        second_stage = plt.Rectangle((x_start + first_stage_length, y_center - second_stage_radius),
-                                    second_stage_length, 2*second_stage_radius,
-                                    fc='white', ec='black')
-        ax.add_patch(second_stage)
-        
-        # Draw nose cone
-        nose_tip_x = x_start + first_stage_length + second_stage_length + nose_length
-        nose_base_x = x_start + first_stage_length + second_stage_length
-        nose_y_points = [y_center - second_stage_radius, y_center + second_stage_radius, y_center]
-        nose_x_points = [nose_base_x, nose_base_x, nose_tip_x]
-        ax.fill(nose_x_points, nose_y_points, fc='white', ec='black')
-        
-        # Draw fins
-        fin_length = first_stage_length * 0.3
-        fin_height = radius * 0.8
-        fin_start_x = x_start + first_stage_length * 0.1
-        
-        # Bottom fin
-        fin_bottom = plt.Polygon([[fin_start_x, y_center - radius],
-                                 [fin_start_x + fin_length, y_center - radius],
-                                 [fin_start_x, y_center - radius - fin_height]],
-                                fc='darkgray', ec='black')
-        ax.add_patch(fin_bottom)
-        
-        # Top fin
-        fin_top = plt.Polygon([[fin_start_x, y_center + radius],
-                              [fin_start_x + fin_length, y_center + radius],
-                              [fin_start_x, y_center + radius + fin_height]],
-                             fc='darkgray', ec='black')
-        ax.add_patch(fin_top)
-        
-        # Draw engines
-        engine_width = radius * 0.6
-        engine_length = first_stage_length * 0.1
-        engine_x = x_start - engine_length
-        ax.add_patch(plt.Rectangle((engine_x, y_center - engine_width/2),
-                                  engine_length, engine_width,
-                                  fc='darkgray', ec='black'))
-        
-        # Add flame/exhaust
-        flame_length = engine_length * 2
-        flame_x_points = [engine_x, engine_x - flame_length, engine_x]
-        flame_y_points = [y_center - engine_width/2, y_center, y_center + engine_width/2]
-        ax.fill(flame_x_points, flame_y_points, fc='orangered', ec='none', alpha=0.7)
+        geometry = _rocket_diagram_geometry(
+            self.rocket_config["total_length"],
+            self.rocket_config["max_diameter"],
+            self.rocket_config["first_stage_length_ratio"],
+            self.rocket_config["nose_cone_length_ratio"]
+        )
+        
+        # Body patches, added as a single collection in drawing order
+        patches = [plt.Polygon(vertices, fc=fc, ec=ec, alpha=alpha)
+                   for vertices, fc, ec, alpha in geometry.polygons]
+        ax.add_collection(PatchCollection(patches, match_original=True))
         
         # Add stage separation line
-        ax.plot([x_start + first_stage_length, x_start + first_stage_length],
-               [y_center - radius*1.2, y_center + radius*1.2],
+        separation_x, separation_half_height = geometry.separation
+        ax.plot([separation_x, separation_x],
+               [-separation_half_height, separation_half_height],
                'r--', linewidth=2)
         
         # Add labels
-        ax.text(x_start + first_stage_length/2, y_center, "STAGE 1", ha='center', va='center')
-        ax.text(x_start + first_stage_length + second_stage_length/2, y_center, "STAGE 2", ha='center', va='center')
-        ax.text(nose_base_x + nose_length/2, y_center, "PAYLOAD", ha='center', va='center')
-        
-        # Add steam engine label
-        ax.text(engine_x, y_center - radius*1.5, "STEAM PROPULSION", ha='center', va='center', weight='bold')
+        for x, y, text, weight in geometry.labels:
+            ax.text(x, y, text, ha='center', va='center', weight=weight)
         
         # Set equal aspect ratio and limits
-        full_length = nose_tip_x - engine_x + flame_length
-        ax.set_xlim([engine_x - flame_length*0.5, nose_tip_x + total_length*0.05])
-        max_height = (radius + fin_height) * 1.5
-        ax.set_ylim([y_center - max_height, y_center + max_height])
+        ax.set_xlim(geometry.xlim)
+        ax.set_ylim(geometry.ylim)
         ax.set_aspect('equal')
         
         # Set title and remove axes
         ax.set_title('Two-Stage Steam Rocket Design')
         ax.axis('off')
+
+
+RocketDiagramGeometry = namedtuple("RocketDiagramGeometry", [
+    "polygons", "separation", "labels", "xlim", "ylim"
+])
+
+
+@lru_cache(maxsize=8)
+def _rocket_diagram_geometry(total_length_mm, max_diameter_mm, first_stage_ratio, nose_cone_ratio):
+    """
+    Lay out the simplified rocket diagram drawn on the dashboard.
+    
+    Memoized on the rocket configuration, so repeated dashboards for the
+    same rocket only rebuild the matplotlib artists.
+    
+    Args:
+        total_length_mm: Total rocket length in mm
+        max_diameter_mm: Maximum rocket diameter in mm
+        first_stage_ratio: First stage length as a fraction of the total
+        nose_cone_ratio: Nose cone length as a fraction of the total
+    
+    Returns:
+        RocketDiagramGeometry with body polygons (vertices, face color,
+        edge color, alpha) in drawing order, the stage separation line,
+        text labels and axis limits
+    """
+    # Get rocket dimensions
+    total_length = total_length_mm / 1000  # m
+    max_diameter = max_diameter_mm / 1000  # m
+    
+    # Simplified rocket shape
+    first_stage_length = total_length * first_stage_ratio
+    second_stage_length = total_length * (1 - first_stage_ratio - nose_cone_ratio)
+    nose_length = total_length * nose_cone_ratio
+    
+    # Center the rocket in the axes
+    x_start = 0
+    y_center = 0
+    radius = max_diameter / 2
+    
+    def rectangle(x, y, width, height):
+        return np.array([[x, y], [x + width, y], [x + width, y + height], [x, y + height]])
+    
+    polygons = []
+    
+    # First stage
+    polygons.append((rectangle(x_start, y_center - radius, first_stage_length, 2*radius),
+                     'lightgray', 'black', None))
+    
+    # Second stage
+    second_stage_radius = radius * 0.9
+    polygons.append((rectangle(x_start + first_stage_length, y_center - second_stage_radius,
+                               second_stage_length, 2*second_stage_radius),
+                     'white', 'black', None))
+    
+    # Nose cone
+    nose_tip_x = x_start + first_stage_length + second_stage_length + nose_length
+    nose_base_x = x_start + first_stage_length + second_stage_length
+    polygons.append((np.array([[nose_base_x, y_center - second_stage_radius],
+                               [nose_base_x, y_center + second_stage_radius],
+                               [nose_tip_x, y_center]]),
+                     'white', 'black', None))
+    
+    # Fins
+    fin_length = first_stage_length * 0.3
+    fin_height = radius * 0.8
+    fin_start_x = x_start + first_stage_length * 0.1
+    
+    # Bottom fin
+    polygons.append((np.array([[fin_start_x, y_center - radius],
+                               [fin_start_x + fin_length, y_center - radius],
+                               [fin_start_x, y_center - radius - fin_height]]),
+                     'darkgray', 'black', None))
+    
+    # Top fin
+    polygons.append((np.array([[fin_start_x, y_center + radius],
+                               [fin_start_x + fin_length, y_center + radius],
+                               [fin_start_x, y_center + radius + fin_height]]),
+                     'darkgray', 'black', None))
+    
+    # Engine
+    engine_width = radius * 0.6
+    engine_length = first_stage_length * 0.1
+    engine_x = x_start - engine_length
+    polygons.append((rectangle(engine_x, y_center - engine_width/2, engine_length, engine_width),
+                     'darkgray', 'black', None))
+    
+    # Flame/exhaust
+    flame_length = engine_length * 2
+    polygons.append((np.array([[engine_x, y_center - engine_width/2],
+                               [engine_x - flame_length, y_center],
+                               [engine_x, y_center + engine_width/2]]),
+                     'orangered', 'none', 0.7))
+    
+    for vertices, _, _, _ in polygons:
+        vertices.flags.writeable = False
+    
+    # Stage separation line position and half height
+    separation = (x_start + first_stage_length, radius * 1.2)
+    
+    labels = (
+        (x_start + first_stage_length/2, y_center, "STAGE 1", 'normal'),
+        (x_start + first_stage_length + second_stage_length/2, y_center, "STAGE 2", 'normal'),
+        (nose_base_x + nose_length/2, y_center, "PAYLOAD", 'normal'),
+        # Steam engine label
+        (engine_x, y_center - radius*1.5, "STEAM PROPULSION", 'bold'),
+    )
+    
+    max_height = (radius + fin_height) * 1.5
+    return RocketDiagramGeometry(
+        polygons=tuple(polygons),
+        separation=separation,
+        labels=labels,
+        xlim=(engine_x - flame_length*0.5, nose_tip_x + total_length*0.05),
+        ylim=(y_center - max_height, y_center + max_height)
+    )
+
+
+@lru_cache(maxsize=1)
+def _graph_canvas():
+    """
+    Figure with an Agg canvas shared by all graphs drawn in this process.
+    
+    Reusing one figure avoids allocating a new canvas and renderer for every graph.
+    """
+    fig = Figure()
+    FigureCanvas(fig)
+    return fig
+
+
+def _graph_figure(figsize):
+    """
+    Clear the shared graph figure and prepare it for a new graph.
+    
+    Args:
+        figsize: Figure size in inches as (width, height)
+    
+    Returns:
+        The cleared matplotlib Figure
+    """
+    fig = _graph_canvas()
+    fig.clf()
+    fig.set_size_inches(figsize)
+    # Undo any spacing left by a previous tight layout
+    fig.subplots_adjust(**{key: matplotlib.rcParams[f"figure.subplot.{key}"]
+                           for key in ("left", "right", "bottom", "top", "wspace", "hspace")})
+    return fig
+
+
+def _render_graph_group(analyzer, method_name, args, kwargs):
+    """
+    Render one group of performance graphs and return the generated filenames.
+    
+    Runs in a worker process on a pickled copy of the analyzer with the shared
+    graph style applied.
+    """
+    with plt.rc_context(GRAPH_RC_PARAMS):
+        generated = getattr(analyzer, method_name)(*args, **kwargs)
+    
+    # The dashboard returns a single filename
+    return [generated] if isinstance(generated, str) else generated
+
+
+def _apogee_for_dry_mass(analyzer, dry_mass):
+    """
+    Simulate a trajectory with a different dry mass and return its apogee.
+    
+    Runs in a worker process on a pickled copy of the analyzer, so the
+    caller's instance is left untouched.
+    """
+    analyzer.dry_mass = dry_mass
+    return analyzer.analyze_trajectory()["apogee"]
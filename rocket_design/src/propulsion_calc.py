@@ -7,10 +7,182 @@ This module focuses on thrust calculation, specific impulse, and propellant requ
 """
 
 import math
+from collections import namedtuple
+from functools import cached_property, lru_cache
 import numpy as np
-import matplotlib.pyplot as plt
 import os
 
+# Numba is optional; without it the propulsion kernels run as plain Python
+try:
+    from numba import njit, prange, guvectorize
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Fallback for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Ahead-of-time compiled propulsion kernel (built by build_propulsion_native.py);
+# without it the JIT kernel below is used
+try:
+    from _propulsion_native import propulsion_metrics as _native_propulsion_metrics
+    NATIVE_KERNEL_AVAILABLE = True
+except ImportError:
+    NATIVE_KERNEL_AVAILABLE = False
+
+# Propulsion model constants
+SEA_LEVEL_PRESSURE = 101325.0  # Pa - ambient pressure for the exhaust velocity
+STEAM_GAMMA = 1.3  # Specific heat ratio of steam
+STEAM_GAS_CONSTANT = 461.5  # J/(kg·K) - Gas constant of water vapor
+WATER_SPECIFIC_HEAT = 4186.0  # J/(kg·K)
+ROOM_TEMPERATURE = 293.15  # K - initial water temperature (20°C)
+BOILING_TEMPERATURE = 373.15  # K - standard boiling point of water (100°C)
+DRY_MASS_RATIO = 3.0  # vehicle dry mass as a multiple of the propellant mass
+# ln(m0/mf) = ln(1 + m_prop/m_dry), constant for a fixed dry-mass ratio
+LOG_MASS_RATIO = math.log1p(1.0 / DRY_MASS_RATIO)
+
+
+PropulsionMetrics = namedtuple("PropulsionMetrics", [
+    "exhaust_velocity", "thrust", "specific_impulse", "delta_v", "energy_required"
+])
+
+
+@njit(cache=True, fastmath=True)
+def _exhaust_velocity(T, p_chamber, p_ambient, k, R):
+    """
+    Ideal nozzle exhaust velocity in m/s.
+    
+    ve = sqrt(2 * k * R * T * (1 - (p_ambient/p_chamber)^((k-1)/k)) / (k-1))
+    """
+    pressure_term = 1.0 - (p_ambient / p_chamber) ** ((k - 1.0) / k)
+    return math.sqrt(2.0 * k * R * T * pressure_term / (k - 1.0))
+
+
+@njit(cache=True, fastmath=True)
+def _propulsion_kernel(T, p_chamber, p_ambient, k, R, cp, Lv, mass, burn, g0):
+    """
+    Scalar propulsion performance of a steam rocket.
+    
+    Args:
+        T: Chamber temperature in K
+        p_chamber: Chamber pressure in Pa
+        p_ambient: Ambient pressure in Pa
+        k: Specific heat ratio of steam
+        R: Gas constant of steam in J/(kg·K)
+        cp: Specific heat capacity of steam in J/(kg·K)
+        Lv: Latent heat of vaporization in J/kg
+        mass: Propellant mass in kg
+        burn: Burn duration in s
+        g0: Standard gravity in m/s²
+    
+    Returns:
+        Tuple of (exhaust velocity in m/s, thrust in N, specific impulse in s,
+        delta-v in m/s, energy required in J)
+    """
+    exhaust_velocity = _exhaust_velocity(T, p_chamber, p_ambient, k, R)
+    
+    # F = m_dot * ve
+    thrust = mass / burn * exhaust_velocity
+    specific_impulse = exhaust_velocity / g0
+    
+    # Tsiolkovsky rocket equation with the approximated vehicle dry mass
+    delta_v = exhaust_velocity * LOG_MASS_RATIO
+    
+    # Heating to boiling, vaporization, and superheating the steam
+    e_heating = mass * WATER_SPECIFIC_HEAT * (BOILING_TEMPERATURE - ROOM_TEMPERATURE)
+    e_vaporization = mass * Lv
+    e_superheat = mass * cp * max(0.0, T - BOILING_TEMPERATURE)
+    energy_required = e_heating + e_vaporization + e_superheat
+    
+    return exhaust_velocity, thrust, specific_impulse, delta_v, energy_required
+
+
+@njit(cache=True, parallel=True)
+def _propulsion_kernel_batch(T, p_chamber, mass, burn, p_ambient, k, R, cp, Lv, g0):
+    """
+    Propulsion performance over arrays of design configurations.
+    
+    Args:
+        T: Array of chamber temperatures in K
+        p_chamber: Array of chamber pressures in Pa
+        mass: Array of propellant masses in kg
+        burn: Array of burn durations in s
+        p_ambient, k, R, cp, Lv, g0: Scalars as in _propulsion_kernel
+    
+    Returns:
+        (5, N) array of exhaust velocity, thrust, specific impulse, delta-v
+        and energy required, in the order of PropulsionMetrics
+    """
+    n = T.size
+    results = np.empty((5, n))
+    for i in prange(n):
+        metrics = _propulsion_kernel(T[i], p_chamber[i], p_ambient, k, R, cp, Lv,
+                                     mass[i], burn[i], g0)
+        for j in range(5):
+            results[j, i] = metrics[j]
+    return results
+
+
+def _thrust_profile_kernel(T, p_MPa, mass, burn, t, out):
+    """
+    Thrust profile of one design at the sample times t (gufunc core).
+    """
+    exhaust_velocity = _exhaust_velocity(T, p_MPa * 1e6, SEA_LEVEL_PRESSURE,
+                                         STEAM_GAMMA, STEAM_GAS_CONSTANT)
+    initial_thrust = mass / burn * exhaust_velocity
+    decay_rate = 0.5 / burn
+    for i in range(t.shape[0]):
+        out[i] = initial_thrust * math.exp(-decay_rate * t[i])
+
+
+@lru_cache(maxsize=1)
+def _thrust_profile_gufunc():
+    """
+    Build the parallel thrust-profile gufunc on first use.
+    
+    guvectorize with explicit signatures compiles (or loads from cache)
+    immediately, so it is kept out of module import.
+    """
+    return guvectorize(['void(f8, f8, f8, f8, f8[:], f8[:])'], '(),(),(),(),(n)->(n)',
+                       nopython=True, target='parallel', cache=True)(_thrust_profile_kernel)
+
+
+def thrust_profile_batch(T, p_MPa, mass, burn, t, out=None):
+    """
+    Thrust profiles of many designs, broadcast over the design parameters.
+    
+    Args:
+        T: Chamber temperatures in K
+        p_MPa: Chamber pressures in MPa
+        mass: Propellant masses in kg
+        burn: Burn durations in seconds
+        t: Sample times in seconds (last axis)
+        out: Optional output array of thrust in N, shaped like the
+            broadcast parameters plus the time axis
+    
+    Returns:
+        Array of thrust in N, shaped like the broadcast parameters plus the time axis
+    """
+    if NUMBA_AVAILABLE:
+        gufunc = _thrust_profile_gufunc()
+        if out is None:
+            return gufunc(T, p_MPa, mass, burn, t)
+        return gufunc(T, p_MPa, mass, burn, t, out)
+    
+    T, p_MPa, mass, burn = (np.asarray(x, dtype=float)[..., np.newaxis]
+                            for x in (T, p_MPa, mass, burn))
+    exhaust_velocity = np.sqrt(
+        2 * STEAM_GAMMA * STEAM_GAS_CONSTANT / (STEAM_GAMMA - 1) * T *
+        (1 - np.power(SEA_LEVEL_PRESSURE / (p_MPa * 1e6), (STEAM_GAMMA - 1) / STEAM_GAMMA))
+    )
+    return np.multiply(mass / burn * exhaust_velocity, np.exp(-0.5 / burn * np.asarray(t)),
+                       out=out)
+
+
 class SteamPropulsionAnalysis:
     """Class for analyzing steam-based rocket propulsion systems."""
     
@@ -36,10 +208,10 @@ class SteamPropulsionAnalysis:
         # Properties for water/steam (will vary with temperature and pressure)
         self.steam_properties = {
             # Specific heat ratio (k) is approximately 1.3 for steam
-            "k": 1.3,
+            "k": STEAM_GAMMA,
             
             # Gas constant for water vapor (J/kg·K)
-            "R": 461.5,
+            "R": STEAM_GAS_CONSTANT,
             
             # Specific heat capacity (J/kg·K) at constant pressure
             "cp": 2080,
@@ -50,6 +222,63 @@ class SteamPropulsionAnalysis:
         
         # Calculate derived values
         self.mass_flow_rate = self.propellant_mass / self.burn_duration  # kg/s
+        
+        # Thrust profile sample times and exponential decay shape, which
+        # depend only on the burn duration. The time points are shared by
+        # every returned profile, so they are read-only
+        self._time_points = np.linspace(0, self.burn_duration, 100)
+        self._time_points.flags.writeable = False
+        self._decay_exp = np.exp(-0.5 / self.burn_duration * self._time_points)
+    
+    @classmethod
+    def batch_evaluate(cls, T, p_MPa, mass, burn, k=STEAM_GAMMA, R=STEAM_GAS_CONSTANT, cp=2080.0, Lv=2257000.0,
+                       g0=9.81, p_ambient=SEA_LEVEL_PRESSURE):
+        """
+        Evaluate propulsion performance for many designs at once with NumPy.
+        
+        Uses the same models as the per-instance methods, broadcast over
+        arrays of design parameters instead of one instance per design.
+        
+        Args:
+            T: Chamber temperatures in K (array or scalar)
+            p_MPa: Chamber pressures in MPa (array or scalar)
+            mass: Propellant masses in kg (array or scalar)
+            burn: Burn durations in seconds (array or scalar)
+            k: Specific heat ratio of steam
+            R: Gas constant of steam in J/(kg·K)
+            cp: Specific heat capacity of steam in J/(kg·K)
+            Lv: Latent heat of vaporization in J/kg
+            g0: Standard gravity in m/s²
+            p_ambient: Ambient pressure in Pa
+        
+        Returns:
+            Dictionary of arrays: exhaust_velocity, thrust, specific_impulse,
+            delta_v and energy_required
+        """
+        T = np.asarray(T, dtype=float)
+        mass = np.asarray(mass, dtype=float)
+        p_chamber = np.asarray(p_MPa, dtype=float) * 1e6
+        
+        pressure_term = 1.0 - np.power(p_ambient / p_chamber, (k - 1) / k)
+        exhaust_velocity = np.sqrt(2 * k * R / (k - 1) * T * pressure_term)
+        
+        mass_flow_rate = mass / np.asarray(burn, dtype=float)
+        thrust = mass_flow_rate * exhaust_velocity
+        specific_impulse = exhaust_velocity / g0
+        
+        # The mass ratio is constant with the dry mass a fixed multiple of the propellant mass
+        delta_v = exhaust_velocity * LOG_MASS_RATIO
+        
+        energy_required = mass * (WATER_SPECIFIC_HEAT * (BOILING_TEMPERATURE - ROOM_TEMPERATURE) + Lv
+                                  + cp * np.maximum(T - BOILING_TEMPERATURE, 0.0))
+        
+        return {
+            "exhaust_velocity": exhaust_velocity,
+            "thrust": thrust,
+            "specific_impulse": specific_impulse,
+            "delta_v": delta_v,
+            "energy_required": energy_required
+        }
     
     def calculate_thrust(self):
         """
@@ -64,11 +293,8 @@ class SteamPropulsionAnalysis:
         # - m_dot is the mass flow rate (kg/s)
         # - ve is the exhaust velocity (m/s)
         
-        # Calculate exhaust velocity
-        exhaust_velocity = self.calculate_exhaust_velocity()
-        
         # Calculate thrust
-        thrust = self.mass_flow_rate * exhaust_velocity
+        thrust = self._metrics.thrust
         
         return thrust
     
@@ -79,33 +305,35 @@ class SteamPropulsionAnalysis:
         Returns:
             Exhaust velocity in m/s
         """
+        return self.exhaust_velocity
+    
+    @cached_property
+    def exhaust_velocity(self):
+        """
+        Exhaust velocity of the steam in m/s, computed once per instance.
+        """
         # For an ideal rocket nozzle, the exhaust velocity is:
         # ve = sqrt(2 * k * R * T * (1 - (p_ambient/p_chamber)^((k-1)/k)) / (k-1))
         # Where:
         # - k is the specific heat ratio
         # - R is the gas constant for the propellant
         # - T is the chamber temperature
-        # - p_ambient is the ambient pressure (assumed to be near vacuum in space)
+        # - p_ambient is the ambient pressure (sea level, 101325 Pa)
         # - p_chamber is the chamber pressure
-        
-        k = self.steam_properties["k"]
-        R = self.steam_properties["R"]
-        T = self.initial_temperature
-        
-        # Convert chamber pressure from MPa to Pa for calculation
-        p_chamber = self.initial_pressure * 1e6
-        
-        # Assume ambient pressure at sea level (101325 Pa)
-        p_ambient = 101325
-        
-        # Calculate pressure ratio term
-        pressure_ratio = p_ambient / p_chamber
-        pressure_term = 1 - math.pow(pressure_ratio, (k-1)/k)
-        
-        # Calculate exhaust velocity
-        exhaust_velocity = math.sqrt(2 * k * R * T * pressure_term / (k-1))
-        
-        return exhaust_velocity
+        return self._metrics.exhaust_velocity
+    
+    @cached_property
+    def _metrics(self):
+        """
+        Performance metrics from the compiled propulsion kernel, computed once per instance.
+        """
+        props = self.steam_properties
+        kernel = _native_propulsion_metrics if NATIVE_KERNEL_AVAILABLE else _propulsion_kernel
+        return PropulsionMetrics(*kernel(
+            float(self.initial_temperature), self.initial_pressure * 1e6, SEA_LEVEL_PRESSURE,
+            float(props["k"]), float(props["R"]), float(props["cp"]), float(props["Lv"]),
+            float(self.propellant_mass), float(self.burn_duration), self.g0
+        ))
     
     def calculate_specific_impulse(self):
         """
@@ -115,8 +343,7 @@ class SteamPropulsionAnalysis:
             Specific impulse in seconds
         """
         # Specific impulse is exhaust velocity divided by Earth's gravitational acceleration
-        exhaust_velocity = self.calculate_exhaust_velocity()
-        Isp = exhaust_velocity / self.g0
+        Isp = self._metrics.specific_impulse
         
         return Isp
     
@@ -143,14 +370,9 @@ class SteamPropulsionAnalysis:
         # - m0 is the initial mass (vehicle + propellant)
         # - mf is the final mass (vehicle without propellant)
         
-        # Assume vehicle dry mass is 3 times the propellant mass
+        # Assume vehicle dry mass is 3 times the propellant mass (DRY_MASS_RATIO)
         # This is a rough approximation for initial calculations
-        vehicle_dry_mass = 3 * self.propellant_mass
-        initial_mass = vehicle_dry_mass + self.propellant_mass
-        final_mass = vehicle_dry_mass
-        
-        exhaust_velocity = self.calculate_exhaust_velocity()
-        delta_v = exhaust_velocity * math.log(initial_mass / final_mass)
+        delta_v = self._metrics.delta_v
         
         return delta_v
     
@@ -162,57 +384,37 @@ class SteamPropulsionAnalysis:
             Energy required in Joules
         """
         # Energy to heat water to boiling + energy to convert to steam + energy to superheat
-        # Assuming water starts at room temperature (20°C)
-        
-        # Specific heat of water (J/kg·K)
-        c_water = 4186
-        
-        # Room temperature (K)
-        room_temp = 293.15
-        
-        # Boiling temperature at the given pressure
-        # For simplicity, assume standard boiling point of water (100°C = 373.15K)
-        # A more accurate calculation would use steam tables
-        boiling_temp = 373.15
-        
-        # Energy to heat water to boiling
-        e_heating = self.propellant_mass * c_water * (boiling_temp - room_temp)
-        
-        # Energy to convert to steam (latent heat)
-        e_vaporization = self.propellant_mass * self.steam_properties["Lv"]
-        
-        # Energy to superheat the steam (if initial_temperature > boiling_temp)
-        e_superheat = 0
-        if self.initial_temperature > boiling_temp:
-            e_superheat = self.propellant_mass * self.steam_properties["cp"] * (self.initial_temperature - boiling_temp)
-        
-        # Total energy
-        total_energy = e_heating + e_vaporization + e_superheat
+        # Assuming water starts at room temperature (20°C) and boils at the
+        # standard boiling point (100°C); a more accurate calculation would
+        # use steam tables
+        total_energy = self._metrics.energy_required
         
         return total_energy
     
-    def calculate_thrust_profile(self):
+    def calculate_thrust_profile(self, initial_thrust=None):
         """
         Calculate the thrust profile over the burn duration.
         
+        Args:
+            initial_thrust: Thrust at ignition in N (calculated if not given)
+        
         Returns:
-            Dictionary with time and thrust arrays
+            Dictionary with time and thrust arrays. The time array is
+            shared and read-only; the thrust array is new on every call.
         """
         # For a steam rocket, thrust typically decreases over time as pressure drops
-        # A simple model is exponential decay
-        time_points = np.linspace(0, self.burn_duration, 100)
+        # A simple model is exponential decay (decay constant 0.5 / burn duration,
+        # precomputed in __init__)
         
         # Initial thrust
-        initial_thrust = self.calculate_thrust()
-        
-        # Decay constant (adjust for realistic behavior)
-        decay_rate = 0.5 / self.burn_duration
+        if initial_thrust is None:
+            initial_thrust = self.calculate_thrust()
         
         # Calculate thrust at each time point
-        thrust_profile = initial_thrust * np.exp(-decay_rate * time_points)
+        thrust_profile = self._decay_exp * initial_thrust
         
         return {
-            "time": time_points,
+            "time": self._time_points,
             "thrust": thrust_profile
         }
     
@@ -228,56 +430,66 @@ class SteamPropulsionAnalysis:
         isp = self.calculate_specific_impulse()
         delta_v = self.calculate_delta_v()
         energy = self.calculate_energy_requirements()
-        exhaust_velocity = self.calculate_exhaust_velocity()
+        exhaust_velocity = self.exhaust_velocity
         
         # Get thrust profile
-        thrust_profile = self.calculate_thrust_profile()
+        thrust_profile = self.calculate_thrust_profile(initial_thrust=thrust)
+        
+        if isp < 100:
+            recommendation = "Consider increasing operating temperature and pressure for better performance"
+        else:
+            recommendation = "Current design provides reasonable performance for a steam system"
         
         # In a real application, this would generate a PDF
-        # For this example, we'll create a text file
+        # For this example, we'll create a text file, written in one call
+        report = f"""STEAM PROPULSION SYSTEM ANALYSIS REPORT
+======================================
+
+Propulsion System Parameters:
+- Propellant: {self.propellant}
+- Initial Temperature: {self.initial_temperature} K ({self.initial_temperature - 273.15:.1f}°C)
+- Initial Pressure: {self.initial_pressure} MPa
+- Propellant Mass: {self.propellant_mass} kg
+- Burn Duration: {self.burn_duration} seconds
+- Mass Flow Rate: {self.mass_flow_rate:.3f} kg/s
+
+Performance Metrics:
+- Thrust: {thrust:.2f} N
+- Specific Impulse: {isp:.2f} s
+- Exhaust Velocity: {exhaust_velocity:.2f} m/s
+- Delta-v Capability: {delta_v:.2f} m/s
+- Energy Required: {energy/1e6:.2f} MJ
+
+Thrust Profile:
+- The thrust starts at maximum and decreases exponentially as pressure drops
+- Initial Thrust: {thrust:.2f} N
+- Final Thrust: {thrust_profile['thrust'][-1]:.2f} N
+
+Efficiency Analysis:
+- Propellant Efficiency: {isp/self.steam_properties['cp']:.3f}
+- Energy to Thrust Conversion: {thrust/(energy/self.burn_duration):.3e} N/W
+
+Recommendations:
+- {recommendation}
+- For increased delta-v, consider reducing vehicle mass or increasing propellant fraction
+
+Notes:
+- This analysis uses simplified models and assumptions
+- Real-world performance may vary due to losses and non-ideal behavior
+- Detailed CFD analysis is recommended for final design verification
+"""
+        
         with open(output_file.replace('.pdf', '.txt'), 'w') as f:
-            f.write("STEAM PROPULSION SYSTEM ANALYSIS REPORT\n")
-            f.write("======================================\n\n")
-            
-            f.write("Propulsion System Parameters:\n")
-            f.write(f"- Propellant: {self.propellant}\n")
-            f.write(f"- Initial Temperature: {self.initial_temperature} K ({self.initial_temperature - 273.15:.1f}°C)\n")
-            f.write(f"- Initial Pressure: {self.initial_pressure} MPa\n")
-            f.write(f"- Propellant Mass: {self.propellant_mass} kg\n")
-            f.write(f"- Burn Duration: {self.burn_duration} seconds\n")
-            f.write(f"- Mass Flow Rate: {self.mass_flow_rate:.3f} kg/s\n\n")
-            
-            f.write("Performance Metrics:\n")
-            f.write(f"- Thrust: {thrust:.2f} N\n")
-            f.write(f"- Specific Impulse: {isp:.2f} s\n")
-            f.write(f"- Exhaust Velocity: {exhaust_velocity:.2f} m/s\n")
-            f.write(f"- Delta-v Capability: {delta_v:.2f} m/s\n")
-            f.write(f"- Energy Required: {energy/1e6:.2f} MJ\n\n")
-            
-            f.write("Thrust Profile:\n")
-            f.write("- The thrust starts at maximum and decreases exponentially as pressure drops\n")
-            f.write(f"- Initial Thrust: {thrust:.2f} N\n")
-            f.write(f"- Final Thrust: {thrust_profile['thrust'][-1]:.2f} N\n\n")
-            
-            f.write("Efficiency Analysis:\n")
-            f.write(f"- Propellant Efficiency: {isp/self.steam_properties['cp']:.3f}\n")
-            f.write(f"- Energy to Thrust Conversion: {thrust/(energy/self.burn_duration):.3e} N/W\n\n")
-            
-            f.write("Recommendations:\n")
-            if isp < 100:
-                f.write("- Consider increasing operating temperature and pressure for better performance\n")
-            else:
-                f.write("- Current design provides reasonable performance for a steam system\n")
-            f.write("- For increased delta-v, consider reducing vehicle mass or increasing propellant fraction\n\n")
-            
-            f.write("Notes:\n")
-            f.write("- This analysis uses simplified models and assumptions\n")
-            f.write("- Real-world performance may vary due to losses and non-ideal behavior\n")
-            f.write("- Detailed CFD analysis is recommended for final design verification\n")
+            f.write(report)
         
         # Generate a simple thrust profile plot and save it
         plt_file = os.path.splitext(output_file)[0] + '_thrust_profile.png'
         try:
+            # Imported lazily so scalar calculations don't pay for matplotlib
+            import matplotlib
+            matplotlib.use('Agg')  # Plot is only written to a file; no GUI backend needed
+            import matplotlib.pyplot as plt
+            
             plt.figure(figsize=(10, 6))
             plt.plot(thrust_profile['time'], thrust_profile['thrust'])
             plt.title('Thrust Profile Over Burn Duration')
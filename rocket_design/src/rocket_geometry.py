@@ -6,11 +6,16 @@ Rocket geometry module for creating the structural components of the two-stage r
 """
 
 import math
+import numpy as np
 import FreeCAD as App
 import Part
 import Draft
 from FreeCAD import Vector
 
+# Shared direction and origin vectors (read-only arguments to the Part API)
+Z_AXIS = Vector(0, 0, 1)
+ORIGIN = Vector(0, 0, 0)
+
 class RocketBuilder:
     """Class for building the geometric components of a two-stage rocket."""
     
@@ -38,29 +43,76 @@ class RocketBuilder:
         self.second_stage_position = Vector(0, 0, self.first_stage_length)
         self.nose_cone_position = Vector(0, 0, self.first_stage_length + self.second_stage_length)
         
-    def create_first_stage(self):
-        """Create the first stage of the rocket."""
+    def build(self):
+        """
+        Create all rocket components and recompute the document once.
+        
+        Returns:
+            Dictionary of the created FreeCAD objects
+        """
+        components = {
+            "first_stage": self.create_first_stage(),
+            "second_stage": self.create_second_stage(),
+            "nose_cone": self.create_nose_cone(),
+            "fins": self.create_fins(),
+            "stage_separation": self.create_stage_separation_mechanism()
+        }
+        
+        self.doc.recompute()
+        return components
+    
+    def _add_static_shape(self, shape, name, label, color):
+        """
+        Add a finished shape to the document as a static Part::Feature.
+        
+        The feature holds a fixed shape with no parametric inputs, so it
+        needs no recompute of its own.
+        
+        Args:
+            shape: Part shape to add
+            name: Internal object name
+            label: Display label
+            color: RGB shape color
+        
+        Returns:
+            The created FreeCAD object
+        """
+        obj = self.doc.addObject("Part::Feature", name)
+        obj.Shape = shape
+        obj.Label = label
+        obj.ViewObject.ShapeColor = color
+        return obj
+    
+    def create_first_stage(self, recompute=False):
+        """
+        Create the first stage of the rocket.
+        
+        Args:
+            recompute: Whether to recompute the document after adding the component
+        """
         # Create a cylinder for the first stage body
         cylinder = Part.makeCylinder(
             self.max_diameter / 2,
             self.first_stage_length,
             self.first_stage_position,
-            Vector(0, 0, 1)
+            Z_AXIS
         )
         
         # Create a FreeCAD object from the shape
-        obj = self.doc.addObject("Part::Feature", "FirstStage")
-        obj.Shape = cylinder
-        obj.Label = "First Stage Body"
-        
-        # Set appearance properties
-        obj.ViewObject.ShapeColor = (0.8, 0.8, 0.8)  # Light gray
+        obj = self._add_static_shape(cylinder, "FirstStage", "First Stage Body",
+                                     (0.8, 0.8, 0.8))  # Light gray
         
-        self.doc.recompute()
+        if recompute:
+            self.doc.recompute()
         return obj
     
-    def create_second_stage(self):
-        """Create the second stage of the rocket."""
+    def create_second_stage(self, recompute=False):
+        """
+        Create the second stage of the rocket.
+        
+        Args:
+            recompute: Whether to recompute the document after adding the component
+        """
         # Create a cylinder with slightly smaller diameter for the second stage
         second_stage_diameter = self.max_diameter * 0.9  # 90% of first stage diameter
         
@@ -68,21 +120,23 @@ class RocketBuilder:
             second_stage_diameter / 2,
             self.second_stage_length,
             self.second_stage_position,
-            Vector(0, 0, 1)
+            Z_AXIS
         )
         
-        obj = self.doc.addObject("Part::Feature", "SecondStage")
-        obj.Shape = cylinder
-        obj.Label = "Second Stage Body"
-        
-        # Set appearance properties
-        obj.ViewObject.ShapeColor = (0.9, 0.9, 0.9)  # Lighter gray
+        obj = self._add_static_shape(cylinder, "SecondStage", "Second Stage Body",
+                                     (0.9, 0.9, 0.9))  # Lighter gray
         
-        self.doc.recompute()
+        if recompute:
+            self.doc.recompute()
         return obj
     
-    def create_nose_cone(self):
-        """Create the rocket nose cone."""
+    def create_nose_cone(self, recompute=False):
+        """
+        Create the rocket nose cone.
+        
+        Args:
+            recompute: Whether to recompute the document after adding the component
+        """
         # Create a cone for the nose
         radius = self.max_diameter * 0.9 / 2  # Match second stage diameter
         
@@ -91,21 +145,23 @@ class RocketBuilder:
             radius, 0,  # Base radius, top radius
             self.nose_cone_length,
             self.nose_cone_position,
-            Vector(0, 0, 1)
+            Z_AXIS
         )
         
-        obj = self.doc.addObject("Part::Feature", "NoseCone")
-        obj.Shape = cone
-        obj.Label = "Nose Cone"
-        
-        # Set appearance properties
-        obj.ViewObject.ShapeColor = (0.9, 0.9, 0.9)  # Lighter gray
+        obj = self._add_static_shape(cone, "NoseCone", "Nose Cone",
+                                     (0.9, 0.9, 0.9))  # Lighter gray
         
-        self.doc.recompute()
+        if recompute:
+            self.doc.recompute()
         return obj
     
-    def create_fins(self):
-        """Create rocket fins for the first stage."""
+    def create_fins(self, recompute=False):
+        """
+        Create rocket fins for the first stage.
+        
+        Args:
+            recompute: Whether to recompute the document after adding the component
+        """
         fin_objects = []
         
         # Fin dimensions
@@ -116,10 +172,16 @@ class RocketBuilder:
         # Position fins at the bottom of the first stage
         fin_z_position = self.first_stage_length * 0.1  # 10% up from the bottom
         
+        # Angles and radial positions of all fins (as Python floats for FreeCAD)
+        angles_deg = np.linspace(0, 360, self.fin_count, endpoint=False)
+        angles_rad = np.deg2rad(angles_deg)
+        fin_radius = self.max_diameter / 2 - fin_thickness / 2
+        fin_x = (np.cos(angles_rad) * fin_radius).tolist()
+        fin_y = (np.sin(angles_rad) * fin_radius).tolist()
+        angles_deg = angles_deg.tolist()
+        
         for i in range(self.fin_count):
-            # Calculate angle for this fin
-            angle = 360 / self.fin_count * i
-            angle_rad = math.radians(angle)
+            angle = angles_deg[i]
             
             # Create a box for the fin
             fin_shape = Part.makeBox(
@@ -129,33 +191,29 @@ class RocketBuilder:
             )
             
             # Rotate and position the fin
-            rotation = App.Rotation(App.Vector(0, 0, 1), angle)
-            fin_shape.rotate(Vector(0, 0, 0), Vector(0, 0, 1), angle)
+            fin_shape.rotate(ORIGIN, Z_AXIS, angle)
             
             # Position fin at correct distance from center and height
-            radius_vector = Vector(
-                math.cos(angle_rad) * (self.max_diameter / 2 - fin_thickness / 2),
-                math.sin(angle_rad) * (self.max_diameter / 2 - fin_thickness / 2),
-                fin_z_position
-            )
+            radius_vector = Vector(fin_x[i], fin_y[i], fin_z_position)
             fin_shape.translate(radius_vector)
             
             # Create FreeCAD object
-            fin_name = f"Fin_{i+1}"
-            fin_obj = self.doc.addObject("Part::Feature", fin_name)
-            fin_obj.Shape = fin_shape
-            fin_obj.Label = f"Fin {i+1}"
-            
-            # Set appearance properties
-            fin_obj.ViewObject.ShapeColor = (0.7, 0.7, 0.7)  # Darker gray
+            fin_obj = self._add_static_shape(fin_shape, f"Fin_{i+1}", f"Fin {i+1}",
+                                             (0.7, 0.7, 0.7))  # Darker gray
             
             fin_objects.append(fin_obj)
         
-        self.doc.recompute()
+        if recompute:
+            self.doc.recompute()
         return fin_objects
     
-    def create_stage_separation_mechanism(self):
-        """Create the mechanism that connects and separates the two stages."""
+    def create_stage_separation_mechanism(self, recompute=False):
+        """
+        Create the mechanism that connects and separates the two stages.
+        
+        Args:
+            recompute: Whether to recompute the document after adding the component
+        """
         # Create a cylindrical ring at the top of the first stage
         
         # Dimensions for separation ring
@@ -164,12 +222,9 @@ class RocketBuilder:
         height = 50  # mm
         
         # Create a tube (hollow cylinder)
-        outer_cylinder = Part.makeCylinder(outer_radius, height, 
-                                           Vector(0, 0, self.first_stage_length - height),
-                                           Vector(0, 0, 1))
-        inner_cylinder = Part.makeCylinder(inner_radius, height, 
-                                           Vector(0, 0, self.first_stage_length - height),
-                                           Vector(0, 0, 1))
+        ring_base = Vector(0, 0, self.first_stage_length - height)
+        outer_cylinder = Part.makeCylinder(outer_radius, height, ring_base, Z_AXIS)
+        inner_cylinder = Part.makeCylinder(inner_radius, height, ring_base, Z_AXIS)
         
         separation_ring = outer_cylinder.cut(inner_cylinder)
         
@@ -179,29 +234,30 @@ class RocketBuilder:
         charge_height = 20
         charges = []
         
+        # Charges sit midway through the ring wall, centered on the ring height
+        charge_r = (outer_radius + inner_radius) / 2
+        charge_z = self.first_stage_length - height/2 - charge_height/2
+        two_pi_over_n = 2 * math.pi / charge_count
+        
         for i in range(charge_count):
-            angle = 360 / charge_count * i
-            angle_rad = math.radians(angle)
+            angle_rad = i * two_pi_over_n
             position = Vector(
-                math.cos(angle_rad) * (outer_radius + inner_radius) / 2,
-                math.sin(angle_rad) * (outer_radius + inner_radius) / 2,
-                self.first_stage_length - height/2 - charge_height/2
+                math.cos(angle_rad) * charge_r,
+                math.sin(angle_rad) * charge_r,
+                charge_z
             )
             
-            charge = Part.makeCylinder(charge_radius, charge_height, position, Vector(0, 0, 1))
+            charge = Part.makeCylinder(charge_radius, charge_height, position, Z_AXIS)
             charges.append(charge)
         
-        # Add charges to separation ring
-        for charge in charges:
-            separation_ring = separation_ring.fuse(charge)
+        # Add all charges to the separation ring in a single boolean fuse
+        separation_ring = separation_ring.fuse(charges)
         
         # Create FreeCAD object
-        sep_obj = self.doc.addObject("Part::Feature", "StageSeparation")
-        sep_obj.Shape = separation_ring
-        sep_obj.Label = "Stage Separation Mechanism"
-        
-        # Set appearance properties
-        sep_obj.ViewObject.ShapeColor = (0.6, 0.6, 0.8)  # Bluish gray
+        sep_obj = self._add_static_shape(separation_ring, "StageSeparation",
+                                         "Stage Separation Mechanism",
+                                         (0.6, 0.6, 0.8))  # Bluish gray
         
-        self.doc.recompute()
+        if recompute:
+            self.doc.recompute()
         return sep_obj
@@ -12,6 +12,8 @@ including dimensions, materials, and structural features.
 import os
 import sys
 import math
+from functools import lru_cache
+import numpy as np
 
 # Add FreeCAD to Python path if not already there
 try:
@@ -25,8 +27,13 @@ except ImportError:
         r"C:\Program Files\FreeCAD\bin"
     ]
     
+    # An explicit FREECAD_PATH is checked before the common locations
+    freecad_env = os.environ.get("FREECAD_PATH")
+    if freecad_env:
+        freecad_paths.insert(0, freecad_env)
+    
     for path in freecad_paths:
-        if os.path.exists(path):
+        if os.path.isdir(path):
             sys.path.append(path)
             print(f"Added FreeCAD path: {path}")
             break
@@ -39,6 +46,13 @@ import FreeCAD as App
 import Part
 from FreeCAD import Base
 
+# The Mesh workbench is optional; without it STL files are exported per object
+try:
+    import Mesh
+    MESH_AVAILABLE = True
+except ImportError:
+    MESH_AVAILABLE = False
+
 print(f"Using FreeCAD version: {App.Version()}")
 
 # Output directory setup
@@ -50,6 +64,14 @@ MODELS_DIR = os.path.join(OUTPUT_DIR, "models")
 # Create output directories
 os.makedirs(MODELS_DIR, exist_ok=True)
 
+# Linear deflection used when tessellating shapes for STL export, as a
+# fraction of each shape's bounding box diagonal, with a floor in mm
+STL_RELATIVE_DEVIATION = 1e-3
+STL_MIN_DEVIATION = 0.05
+
+# Export STEP/STL straight from the shapes, without recomputing or saving the FCStd document
+SKIP_DOC_EXPORT = os.environ.get("ROCKET_SKIP_DOC_EXPORT", "").lower() in ("1", "true", "yes")
+
 # Rocket configuration from the design report
 rocket_config = {
     # Overall dimensions
@@ -97,28 +119,28 @@ def create_ogive_nosecone(length, diameter, doc, name="NoseCone"):
     """
     Create an ogive-shaped nosecone
     """
-    # Ogive nosecone equation: y = radius * sqrt(1 - (x/length)²)
+    # Tangent ogive: a circular arc of radius rho through the tip that meets
+    # the body tangentially at the base, rho = (radius² + length²) / (2·radius)
     radius = diameter / 2
-    points = []
-    num_points = 30
-    
-    for i in range(num_points+1):
-        x = length * (i / num_points)
-        # Ogive shape using square root function
-        y = radius * math.sqrt(1 - ((x - length) / length)**2)
-        points.append(Base.Vector(0, y, x))
-    
-    # Add center point at base
-    points.append(Base.Vector(0, 0, 0))
-    
-    # Create a wire
-    wire = Part.makePolygon(points)
-    
-    # Create face by rotating around Z axis
-    face = wire.makeRevolution(Base.Vector(0, 0, 0), Base.Vector(0, 0, 1), 360)
-    
-    # Create solid
-    solid = Part.makeSolid(face)
+    rho = (radius**2 + length**2) / (2 * radius)
+    mid_z = length / 2
+    mid_y = math.sqrt(rho**2 - (length - mid_z)**2) + radius - rho
+    
+    tip = Base.Vector(0, 0, 0)
+    base_edge = Base.Vector(0, radius, length)
+    base_center = Base.Vector(0, 0, length)
+    
+    # Close the arc profile back to the Z axis
+    arc = Part.Arc(tip, Base.Vector(0, mid_y, mid_z), base_edge)
+    wire = Part.Wire([
+        arc.toShape(),
+        Part.LineSegment(base_edge, base_center).toShape(),
+        Part.LineSegment(base_center, tip).toShape()
+    ])
+    
+    # Revolve the closed profile around the Z axis into a solid
+    face = Part.Face(wire)
+    solid = face.revolve(Base.Vector(0, 0, 0), Base.Vector(0, 0, 1), 360)
     
     # Add to document
     obj = doc.addObject("Part::Feature", name)
@@ -126,9 +148,9 @@ def create_ogive_nosecone(length, diameter, doc, name="NoseCone"):
     
     return obj
 
-def create_fin(root_chord, tip_chord, height, sweep, thickness, doc, name="Fin"):
+def make_fin_shape(root_chord, tip_chord, height, sweep, thickness):
     """
-    Create a swept fin with the given dimensions
+    Build the solid of a swept fin at the origin
     """
     # Create points for the fin profile
     p1 = Base.Vector(0, 0, 0)                     # Root leading edge
@@ -141,7 +163,63 @@ def create_fin(root_chord, tip_chord, height, sweep, thickness, doc, name="Fin")
     face = Part.Face(wire)
     
     # Extrude the face to create a solid
-    fin_solid = face.extrude(Base.Vector(0, 0, thickness))
+    return face.extrude(Base.Vector(0, 0, thickness))
+
+def stl_deviation(shape):
+    """
+    Tessellation deviation scaled to the size of a shape
+    """
+    return max(STL_MIN_DEVIATION, shape.BoundBox.DiagonalLength * STL_RELATIVE_DEVIATION)
+
+@lru_cache(maxsize=32)
+def tessellate_fin(root_chord, tip_chord, height, sweep, thickness, deviation=None):
+    """
+    Tessellate a fin once per set of dimensions, independent of its placement
+    
+    Returns:
+        Tuple of (read-only (N, 3) vertex array, triangle index tuples)
+    """
+    fin_solid = make_fin_shape(root_chord, tip_chord, height, sweep, thickness)
+    if deviation is None:
+        deviation = stl_deviation(fin_solid)
+    points, triangles = fin_solid.tessellate(deviation)
+    vertices = np.array([(p.x, p.y, p.z) for p in points], dtype=float).reshape(-1, 3)
+    vertices.flags.writeable = False
+    return vertices, tuple(triangles)
+
+def place_vertices(vertices, placement):
+    """
+    Apply a FreeCAD placement to an (N, 3) vertex array in one batch
+    """
+    matrix = np.array(placement.toMatrix().A, dtype=float).reshape(4, 4)
+    placed = vertices @ matrix[:3, :3].T + matrix[:3, 3]
+    return [Base.Vector(*p) for p in placed.tolist()]
+
+def cached_tessellate(shape, cache, deviation=None):
+    """
+    Tessellate a shape once per cache, keyed by its geometry hash
+    """
+    key = shape.hashCode()
+    if key not in cache:
+        cache[key] = shape.tessellate(deviation if deviation is not None else stl_deviation(shape))
+    return cache[key]
+
+def baked_shape(shape):
+    """
+    Copy a shape with its placement applied to the geometry itself
+    """
+    baked = shape.copy()
+    matrix = baked.Placement.toMatrix()
+    baked.Placement = Base.Placement()
+    # Copy the geometry so the rigid transform lands in it rather than in a location
+    baked.transformShape(matrix, True)
+    return baked
+
+def create_fin(root_chord, tip_chord, height, sweep, thickness, doc, name="Fin"):
+    """
+    Create a swept fin with the given dimensions
+    """
+    fin_solid = make_fin_shape(root_chord, tip_chord, height, sweep, thickness)
     
     # Add to document
     obj = doc.addObject("Part::Feature", name)
@@ -149,12 +227,19 @@ def create_fin(root_chord, tip_chord, height, sweep, thickness, doc, name="Fin")
     
     return obj
 
+@lru_cache(maxsize=16)
+def nozzle_shape(throat_diameter, exit_diameter, length):
+    """
+    Build the truncated-cone nozzle shape once per set of dimensions
+    """
+    return Part.makeCone(throat_diameter/2, exit_diameter/2, length)
+
 def create_nozzle(throat_diameter, exit_diameter, length, doc, name="Nozzle"):
     """
     Create a rocket engine nozzle
     """
-    # Create the nozzle as a truncated cone
-    nozzle = Part.makeCone(throat_diameter/2, exit_diameter/2, length)
+    # Copy the cached truncated cone so each nozzle owns its shape
+    nozzle = nozzle_shape(throat_diameter, exit_diameter, length).copy()
     
     # Add to document
     obj = doc.addObject("Part::Feature", name)
@@ -166,16 +251,23 @@ def create_pressure_vessel(diameter, length, wall_thickness, doc, name="Pressure
     """
     Create a pressure vessel with the specified wall thickness
     """
-    # Create outer cylinder
-    outer = Part.makeCylinder(diameter/2, length)
-    
-    # Create inner cylinder for hollowing
-    inner_diameter = diameter - 2*wall_thickness
-    inner = Part.makeCylinder(inner_diameter/2, length - wall_thickness)
-    inner.translate(Base.Vector(0, 0, wall_thickness))
-    
-    # Cut inner from outer
-    vessel = outer.cut(inner)
+    outer_radius = diameter/2
+    inner_radius = diameter/2 - wall_thickness
+    
+    # Half cross-section of the vessel wall and closed base in the XZ plane
+    profile = Part.makePolygon([
+        Base.Vector(0, 0, 0),
+        Base.Vector(outer_radius, 0, 0),
+        Base.Vector(outer_radius, 0, length),
+        Base.Vector(inner_radius, 0, length),
+        Base.Vector(inner_radius, 0, wall_thickness),
+        Base.Vector(0, 0, wall_thickness),
+        Base.Vector(0, 0, 0)
+    ])
+    
+    # Revolve the profile around the Z axis instead of cutting two cylinders
+    face = Part.Face(profile)
+    vessel = face.revolve(Base.Vector(0, 0, 0), Base.Vector(0, 0, 1), 360)
     
     # Add to document
     obj = doc.addObject("Part::Feature", name)
@@ -199,21 +291,20 @@ def create_stage_separation_system(diameter, height, doc, name="StageSeparation"
     bolt_height = 15
     bolt_radius = diameter/2 - ring_thickness/2
     
-    bolts = []
-    for i in range(bolt_count):
-        angle = 360 / bolt_count * i
-        angle_rad = math.radians(angle)
-        x = bolt_radius * math.cos(angle_rad)
-        y = bolt_radius * math.sin(angle_rad)
-        
-        bolt = Part.makeCylinder(bolt_diameter/2, bolt_height, 
-                                Base.Vector(x, y, -bolt_height/2), 
-                                Base.Vector(0, 0, 1))
-        bolts.append(bolt)
+    # Bolt positions for all angles at once (as Python floats for FreeCAD)
+    angles = np.linspace(0, 2*np.pi, bolt_count, endpoint=False)
+    xs = (bolt_radius * np.cos(angles)).tolist()
+    ys = (bolt_radius * np.sin(angles)).tolist()
+    
+    bolts = [
+        Part.makeCylinder(bolt_diameter/2, bolt_height,
+                          Base.Vector(x, y, -bolt_height/2),
+                          Base.Vector(0, 0, 1))
+        for x, y in zip(xs, ys)
+    ]
     
-    # Combine all bolts with the ring
-    for bolt in bolts:
-        ring = ring.fuse(bolt)
+    # Combine all bolts with the ring in a single multi-argument fuse
+    ring = ring.fuse(bolts)
     
     # Add to document
     obj = doc.addObject("Part::Feature", name)
@@ -267,25 +358,30 @@ def create_steam_rocket_model():
     # --- Create Fins ---
     print(f"Creating {rocket_config['fin_count']} fins...")
     fin_base_z = rocket_config["first_stage_length"] * 0.1
-    for i in range(rocket_config["fin_count"]):
-        angle = 360 / rocket_config["fin_count"] * i
-        fin = create_fin(
-            rocket_config["fin_root_chord"],
-            rocket_config["fin_tip_chord"],
-            rocket_config["fin_height"],
-            rocket_config["fin_sweep"],
-            rocket_config["fin_thickness"],
-            doc,
-            f"Fin_{i+1}"
-        )
-        
-        # Rotate around Z axis
-        fin.Placement.Rotation = App.Rotation(App.Vector(0, 0, 1), angle)
-        
-        # Position at the correct height and radius
-        radial_pos = rocket_config["first_stage_diameter"] / 2
-        fin.Placement.Base.z = fin_base_z
-        fin.Placement.Base.x = -rocket_config["fin_thickness"] / 2
+    fin_dims = (
+        rocket_config["fin_root_chord"],
+        rocket_config["fin_tip_chord"],
+        rocket_config["fin_height"],
+        rocket_config["fin_sweep"],
+        rocket_config["fin_thickness"]
+    )
+    
+    # Placements of all fins: rotated around the Z axis, at the fin base height.
+    # Each is assigned as a whole Placement, because obj.Placement returns a
+    # copy and writes to its Rotation or Base would not reach the object
+    fin_count = rocket_config["fin_count"]
+    z_axis = App.Vector(0, 0, 1)
+    fin_base = App.Vector(-rocket_config["fin_thickness"] / 2, 0, fin_base_z)
+    fin_placements = [
+        App.Placement(fin_base, App.Rotation(z_axis, 360 / fin_count * i))
+        for i in range(fin_count)
+    ]
+    
+    fin_names = set()
+    for i, placement in enumerate(fin_placements):
+        fin = create_fin(*fin_dims, doc, f"Fin_{i+1}")
+        fin_names.add(fin.Name)
+        fin.Placement = placement
     
     # --- Create First Stage Engine Nozzle ---
     print("Creating first stage engine nozzle...")
@@ -350,52 +446,67 @@ def create_steam_rocket_model():
     # Position at the interface between stages
     separation.Placement.Base = Base.Vector(0, 0, rocket_config["first_stage_length"] - 25)
     
-    # Refresh the document
-    doc.recompute()
+    if SKIP_DOC_EXPORT:
+        # Part features already carry their placement in their Shape, so the
+        # exports below need neither a recompute nor the saved document
+        print("Skipping FreeCAD document save (ROCKET_SKIP_DOC_EXPORT is set)")
+    else:
+        # Refresh the document
+        doc.recompute()
+        
+        # Save the document
+        fcstd_file = os.path.join(MODELS_DIR, "two_stage_steam_rocket.FCStd")
+        doc.saveAs(fcstd_file)
+        print(f"Saved FreeCAD document to: {fcstd_file}")
     
-    # Save the document
-    fcstd_file = os.path.join(MODELS_DIR, "two_stage_steam_rocket.FCStd")
-    doc.saveAs(fcstd_file)
-    print(f"Saved FreeCAD document to: {fcstd_file}")
+    # Objects with geometry, shared by the STEP and STL exports
+    shape_objs = [obj for obj in doc.Objects if hasattr(obj, "Shape")]
     
     # Export to STEP format
     try:
         step_file = os.path.join(MODELS_DIR, "two_stage_steam_rocket.step")
         
-        # Method 1: Using Import module
-        try:
-            import Import
-            Import.export([obj for obj in doc.Objects if hasattr(obj, "Shape")], step_file)
-            print(f"Exported STEP file to: {step_file}")
-        except:
-            # Method 2: Using Part module directly
-            compound = Part.Compound([obj.Shape for obj in doc.Objects if hasattr(obj, "Shape")])
-            compound.exportStep(step_file)
-            print(f"Exported STEP file to: {step_file} (using Part module)")
+        # Write every shape in one STEP transfer, with placements baked into
+        # the geometry so the file holds a flat compound without nested transforms
+        compound = Part.Compound([baked_shape(obj.Shape) for obj in shape_objs])
+        compound.exportStep(step_file)
+        print(f"Exported STEP file to: {step_file}")
     except Exception as e:
         print(f"Error exporting STEP file: {e}")
     
     # Export to STL format
+    stl_cache = {}  # tessellations shared by the STL export paths of this run
     try:
         stl_file = os.path.join(MODELS_DIR, "two_stage_steam_rocket.stl")
         
         # Method 1: Using Mesh module
         try:
-            import Mesh
+            if not MESH_AVAILABLE:
+                raise ImportError("FreeCAD Mesh module is not available")
             combined_mesh = Mesh.Mesh()
-            for obj in doc.Objects:
-                if hasattr(obj, "Shape"):
-                    mesh = Mesh.Mesh(obj.Shape.tessellate(0.1))
-                    combined_mesh.addMesh(mesh)
+            for obj in shape_objs:
+                if obj.Name in fin_names:
+                    # Identical fins share one tessellation, moved by their placement
+                    vertices, triangles = tessellate_fin(*fin_dims)
+                    mesh = Mesh.Mesh((place_vertices(vertices, obj.Placement), list(triangles)))
+                else:
+                    mesh = Mesh.Mesh(cached_tessellate(obj.Shape, stl_cache))
+                combined_mesh.addMesh(mesh)
             combined_mesh.write(stl_file)
             print(f"Exported STL file to: {stl_file}")
         except Exception as e:
             # Method 2: Export individual meshes
             print(f"Could not export combined STL, using individual exports: {e}")
-            for i, obj in enumerate(doc.Objects):
-                if hasattr(obj, "Shape"):
-                    obj_stl = os.path.join(MODELS_DIR, f"{obj.Name}.stl")
-                    obj.Shape.exportStl(obj_stl)
+            stl_prefix = os.path.join(MODELS_DIR, "")
+            for obj in shape_objs:
+                shape = obj.Shape
+                obj_stl = f"{stl_prefix}{obj.Name}.stl"
+                tessellation = stl_cache.get(shape.hashCode())
+                if tessellation is not None and MESH_AVAILABLE:
+                    # Reuse the tessellation made before the combined export failed
+                    Mesh.Mesh(tessellation).write(obj_stl)
+                else:
+                    shape.exportStl(obj_stl)
             print(f"Exported individual STL files to: {MODELS_DIR}")
     except Exception as e:
         print(f"Error exporting STL file: {e}")
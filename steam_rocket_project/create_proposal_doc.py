@@ -15,6 +15,80 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.style import WD_STYLE_TYPE
 from datetime import datetime
 
+# Proposal sections as (heading level, heading, body paragraphs, bullet points)
+PROPOSAL_SECTIONS = [
+    # Executive Summary
+    (1, "Executive Summary", (
+        "This proposal outlines the design and engineering specifications for a two-stage "
+        "steam-powered rocket system. Our design addresses all requirements specified in "
+        "the project brief, providing detailed AutoCAD designs, pressure system analysis, "
+        "and comprehensive thrust and propellant calculations.",
+        "Key features of our proposed solution include:"
+    ), (
+        "A two-stage vehicle with modular separation system for optimal performance",
+        "Detailed pressure vessel design with appropriate safety factors",
+        "Comprehensive thrust calculations for steam propulsion",
+        "Precise propellant (water) requirements for specified mission parameters",
+        "Complete set of engineering drawings and specifications for manufacturing"
+    )),
+    
+    # Technical Approach
+    (1, "Technical Approach", (
+        "Our approach to the steam rocket design combines fundamental engineering "
+        "principles with practical design considerations to achieve a reliable and "
+        "efficient propulsion system.",
+    ), ()),
+    (2, "Steam Propulsion Principles", ("[Placeholder for steam propulsion explanation and equations]",), ()),
+    (2, "Two-Stage Design Rationale", ("[Placeholder for two-stage design explanation]",), ()),
+    (2, "Material Selection", ("[Placeholder for material selection explanation]",), ()),
+    
+    # Design Specifications
+    (1, "Design Specifications", (
+        "The following specifications detail the engineering parameters for both stages "
+        "of the rocket system, including pressure vessel requirements, nozzle geometry, "
+        "and performance calculations.",
+    ), ()),
+    (2, "First Stage Specifications", ("[Placeholder for first stage specifications]",), ()),
+    (2, "Second Stage Specifications", ("[Placeholder for second stage specifications]",), ()),
+    (2, "Performance Calculations", ("[Placeholder for performance calculations and charts]",), ()),
+    
+    # Engineering Drawings
+    (1, "Engineering Drawings", (
+        "The following section contains engineering drawings and visualizations of the "
+        "rocket design, including component layouts, stage separation interfaces, and "
+        "structural outlines.",
+    ), ()),
+    (2, "Overall Vehicle Configuration", ("[Placeholder for vehicle configuration drawings]",), ()),
+    (2, "Pressure Vessel Design", ("[Placeholder for pressure vessel drawings]",), ()),
+    (2, "Nozzle Geometry", ("[Placeholder for nozzle geometry drawings]",), ()),
+    
+    # Project Implementation
+    (1, "Project Implementation", (
+        "The following timeline and deliverables outline our approach to implementing "
+        "this design project, including key milestones and delivery schedule.",
+    ), ()),
+    (2, "Timeline", ("[Placeholder for project timeline]",), ()),
+    (2, "Deliverables", (
+        "The complete project includes the following deliverables:",
+    ), (
+        "AutoCAD (.dwg) files for the complete two-stage vehicle",
+        "PDF report with pressure vessel calculations and safety analysis",
+        "Excel spreadsheet with thrust and propellant calculations",
+        "3D model files (.step or .stl) for visualization and manufacturing",
+        "Technical documentation with assembly and integration instructions"
+    )),
+    
+    # Appendix
+    (1, "Appendix: Detailed Calculations", (
+        "This appendix contains the detailed engineering calculations for the steam rocket "
+        "design, including mathematical derivations, parameter sensitivity analysis, and "
+        "reference data.",
+    ), ()),
+    (2, "Thrust Calculations", ("[Placeholder for detailed thrust calculations]",), ()),
+    (2, "Pressure Vessel Analysis", ("[Placeholder for pressure vessel analysis]",), ()),
+    (2, "Propellant Requirements", ("[Placeholder for propellant calculations]",), ()),
+]
+
 def create_document_structure():
     """Create the basic structure for the proposal document."""
     doc = Document()
@@ -27,7 +101,7 @@ def create_document_structure():
         style_name = f'Custom Heading {i}'
         if style_name not in styles:
             style = styles.add_style(style_name, WD_STYLE_TYPE.PARAGRAPH)
-            style.base_style = styles['Heading {}'.format(i)]
+            style.base_style = styles[f'Heading {i}']
             font = style.font
             font.size = Pt(size)
             font.bold = True
@@ -43,14 +117,19 @@ def create_document_structure():
         paragraph_format = style.paragraph_format
         paragraph_format.space_after = Pt(6)
     
+    # Resolve the styles used below once; python-docx looks names up linearly
+    body_style = styles['Custom Body']
+    title_style = styles['Title']
+    subtitle_style = styles['Subtitle']
+    
     # Title page
     title = doc.add_paragraph("Two-Stage Steam Rocket Design")
     title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    title.style = styles['Title']
+    title.style = title_style
     
     subtitle = doc.add_paragraph("Engineering Proposal for Aerospace Design Project")
     subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    subtitle.style = styles['Subtitle']
+    subtitle.style = subtitle_style
     
     # Add date
     date = doc.add_paragraph(f"Prepared: {datetime.now().strftime('%B %d, %Y')}")
@@ -64,141 +143,15 @@ def create_document_structure():
     doc.add_paragraph("(Table of Contents will be generated automatically)")
     doc.add_page_break()
     
-    # Executive Summary
-    doc.add_heading("Executive Summary", level=1)
-    summary = doc.add_paragraph(
-        "This proposal outlines the design and engineering specifications for a two-stage "
-        "steam-powered rocket system. Our design addresses all requirements specified in "
-        "the project brief, providing detailed AutoCAD designs, pressure system analysis, "
-        "and comprehensive thrust and propellant calculations."
-    )
-    summary.style = 'Custom Body'
-    
-    doc.add_paragraph(
-        "Key features of our proposed solution include:"
-    ).style = 'Custom Body'
-    
-    bullet_points = [
-        "A two-stage vehicle with modular separation system for optimal performance",
-        "Detailed pressure vessel design with appropriate safety factors",
-        "Comprehensive thrust calculations for steam propulsion",
-        "Precise propellant (water) requirements for specified mission parameters",
-        "Complete set of engineering drawings and specifications for manufacturing"
-    ]
-    
-    for point in bullet_points:
-        p = doc.add_paragraph(point, style='List Bullet')
-        p.style = 'Custom Body'
-    
-    doc.add_page_break()
-    
-    # Technical Approach
-    doc.add_heading("Technical Approach", level=1)
-    doc.add_paragraph(
-        "Our approach to the steam rocket design combines fundamental engineering "
-        "principles with practical design considerations to achieve a reliable and "
-        "efficient propulsion system."
-    ).style = 'Custom Body'
-    
-    # Add subsections for Technical Approach
-    doc.add_heading("Steam Propulsion Principles", level=2)
-    doc.add_paragraph("[Placeholder for steam propulsion explanation and equations]").style = 'Custom Body'
-    
-    doc.add_heading("Two-Stage Design Rationale", level=2)
-    doc.add_paragraph("[Placeholder for two-stage design explanation]").style = 'Custom Body'
-    
-    doc.add_heading("Material Selection", level=2)
-    doc.add_paragraph("[Placeholder for material selection explanation]").style = 'Custom Body'
-    
-    doc.add_page_break()
-    
-    # Design Specifications
-    doc.add_heading("Design Specifications", level=1)
-    doc.add_paragraph(
-        "The following specifications detail the engineering parameters for both stages "
-        "of the rocket system, including pressure vessel requirements, nozzle geometry, "
-        "and performance calculations."
-    ).style = 'Custom Body'
-    
-    # Add subsections for Design Specifications
-    doc.add_heading("First Stage Specifications", level=2)
-    doc.add_paragraph("[Placeholder for first stage specifications]").style = 'Custom Body'
-    
-    doc.add_heading("Second Stage Specifications", level=2)
-    doc.add_paragraph("[Placeholder for second stage specifications]").style = 'Custom Body'
-    
-    doc.add_heading("Performance Calculations", level=2)
-    doc.add_paragraph("[Placeholder for performance calculations and charts]").style = 'Custom Body'
-    
-    doc.add_page_break()
-    
-    # Engineering Drawings
-    doc.add_heading("Engineering Drawings", level=1)
-    doc.add_paragraph(
-        "The following section contains engineering drawings and visualizations of the "
-        "rocket design, including component layouts, stage separation interfaces, and "
-        "structural outlines."
-    ).style = 'Custom Body'
-    
-    # Add subsections for Engineering Drawings
-    doc.add_heading("Overall Vehicle Configuration", level=2)
-    doc.add_paragraph("[Placeholder for vehicle configuration drawings]").style = 'Custom Body'
-    
-    doc.add_heading("Pressure Vessel Design", level=2)
-    doc.add_paragraph("[Placeholder for pressure vessel drawings]").style = 'Custom Body'
-    
-    doc.add_heading("Nozzle Geometry", level=2)
-    doc.add_paragraph("[Placeholder for nozzle geometry drawings]").style = 'Custom Body'
-    
-    doc.add_page_break()
-    
-    # Project Implementation
-    doc.add_heading("Project Implementation", level=1)
-    doc.add_paragraph(
-        "The following timeline and deliverables outline our approach to implementing "
-        "this design project, including key milestones and delivery schedule."
-    ).style = 'Custom Body'
-    
-    # Add subsections for Project Implementation
-    doc.add_heading("Timeline", level=2)
-    doc.add_paragraph("[Placeholder for project timeline]").style = 'Custom Body'
-    
-    doc.add_heading("Deliverables", level=2)
-    doc.add_paragraph(
-        "The complete project includes the following deliverables:"
-    ).style = 'Custom Body'
-    
-    deliverables = [
-        "AutoCAD (.dwg) files for the complete two-stage vehicle",
-        "PDF report with pressure vessel calculations and safety analysis",
-        "Excel spreadsheet with thrust and propellant calculations",
-        "3D model files (.step or .stl) for visualization and manufacturing",
-        "Technical documentation with assembly and integration instructions"
-    ]
-    
-    for item in deliverables:
-        p = doc.add_paragraph(item, style='List Bullet')
-        p.style = 'Custom Body'
-    
-    doc.add_page_break()
-    
-    # Appendix
-    doc.add_heading("Appendix: Detailed Calculations", level=1)
-    doc.add_paragraph(
-        "This appendix contains the detailed engineering calculations for the steam rocket "
-        "design, including mathematical derivations, parameter sensitivity analysis, and "
-        "reference data."
-    ).style = 'Custom Body'
-    
-    # Add subsections for Appendix
-    doc.add_heading("Thrust Calculations", level=2)
-    doc.add_paragraph("[Placeholder for detailed thrust calculations]").style = 'Custom Body'
-    
-    doc.add_heading("Pressure Vessel Analysis", level=2)
-    doc.add_paragraph("[Placeholder for pressure vessel analysis]").style = 'Custom Body'
-    
-    doc.add_heading("Propellant Requirements", level=2)
-    doc.add_paragraph("[Placeholder for propellant calculations]").style = 'Custom Body'
+    # Proposal sections; each top-level section starts on a new page
+    for index, (level, heading, paragraphs, bullets) in enumerate(PROPOSAL_SECTIONS):
+        if level == 1 and index > 0:
+            doc.add_page_break()
+        doc.add_heading(heading, level=level)
+        for text in paragraphs:
+            doc.add_paragraph(text, style=body_style)
+        for text in bullets:
+            doc.add_paragraph(text, style=body_style)
     
     # Save the document
     output_path = os.path.join(os.getcwd(), "Steam_Rocket_Proposal_Initial.docx")